@@ -1 +1,10 @@
-from dict2any.parse import DEFAULT_PARSERS, parse
+from dict2any.parse import (
+    DEFAULT_PARSERS,
+    Decoder,
+    default_parsers,
+    iter_parse,
+    parse,
+    parse_many,
+)
+from dict2any.parsers import Discriminator, Typecode
+from dict2any.unparse import Encoder, unparse
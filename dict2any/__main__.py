@@ -0,0 +1,55 @@
+import argparse
+import importlib
+import sys
+from pathlib import Path
+from typing import Any
+
+from dict2any.codegen import generate_module
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m dict2any')
+    commands = parser.add_subparsers(dest='command', required=True)
+    compile_parser = commands.add_parser(
+        'compile', help='Generate a standalone module which decodes a type, without any introspection at import time'
+    )
+    compile_parser.add_argument('target', help='The type to decode, as package.module:Type')
+    compile_parser.add_argument('-o', '--output', type=Path, help='Where to write the module (default: stdout)')
+    compile_parser.add_argument(
+        '--check',
+        action='store_true',
+        help="Exit with an error if the output file isn't up to date, instead of writing it",
+    )
+    args = parser.parse_args(argv)
+
+    command = f'python -m dict2any compile {args.target}'
+    if args.output is not None:
+        command += f' -o {args.output.as_posix()}'
+    source = generate_module(_load(args.target), command)
+
+    if args.check:
+        if args.output is None:
+            parser.error('--check requires --output')
+        if not args.output.exists() or args.output.read_text() != source:
+            print(f'{args.output} is out of date. Run `{command}` to regenerate it', file=sys.stderr)
+            return 1
+        return 0
+    if args.output is None:
+        sys.stdout.write(source)
+    else:
+        args.output.write_text(source)
+    return 0
+
+
+def _load(target: str) -> Any:
+    module_name, _, qualname = target.partition(':')
+    if not module_name or not qualname:
+        raise SystemExit(f'Invalid target {target!r}, expected package.module:Type')
+    obj: Any = importlib.import_module(module_name)
+    for name in qualname.split('.'):
+        obj = getattr(obj, name)
+    return obj
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,626 @@
+import dataclasses
+import typing
+import weakref
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from itertools import islice, repeat
+from pathlib import Path
+from types import GenericAlias, UnionType
+from typing import (
+    Annotated,
+    Any,
+    Literal,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from dict2any.jq_path import JqPath
+from dict2any.parse import DEFAULT_DECODER, Decoder, _get_decoder
+from dict2any.parsers import (
+    ClassParser,
+    DataclassParser,
+    DictParser,
+    ListParser,
+    LiteralParser,
+    NamedTupleParser,
+    Parser,
+    PathParser,
+    TupleParser,
+    TypedDictParser,
+    UnionParser,
+)
+from dict2any.parsers.class_parser import get_signature
+from dict2any.parsers.dataclass import DataclassField, DataclassSchema, get_schema
+from dict2any.parsers.dict import get_typed_dict_schema
+from dict2any.parsers.parser import returns_unchanged
+from dict2any.parsers.tuple import get_named_tuple_fields
+from dict2any.parsers.type_cache import type_key
+from dict2any.parsers.union import get_union_schema
+
+T = TypeVar('T')
+
+# Nodes which are generated inline into their parent. Every other kind gets its own function
+INLINE_KINDS = frozenset(['any', 'check', 'path', 'literal', 'fallback'])
+
+
+@dataclass(eq=False)
+class _Node:
+    kind: str
+    field_type: Any
+    parser: Parser | None = None
+    # The name of the generated function, for kinds which aren't inlined
+    name: str = ''
+    # (key, node) pairs. The key is a field name, an index, or None, depending on the kind
+    children: list[tuple[Any, '_Node']] = field(default_factory=list)
+    needs_path: bool = False
+
+
+class _Generator:
+    # Turns the parsers a Decoder picks for a type (and everything nested in it) into straight-line python source.
+    # The builtin parsers are replaced by equivalent generated code. Anything else (e.g. custom parsers) is still called
+    # through the parser, so the result always matches decoder.parse
+    def __init__(self, decoder: Decoder):
+        self.decoder = decoder
+        self.namespace: dict[str, Any] = {}
+        self._refs: dict[int, str] = {}
+        self._nodes: dict[Any, _Node] = {}
+        self._functions: list[_Node] = []
+        self._root_path = JqPath.parse('.')
+
+    def ref(self, obj: Any, hint: str = 'ref') -> str:
+        # Returns a name which refers to obj in the generated code
+        if id(obj) not in self._refs:
+            name = f'{hint}_{len(self._refs)}'
+            self._refs[id(obj)] = name
+            self.namespace[name] = obj
+        return self._refs[id(obj)]
+
+    def generate(self, cls: Any) -> str:
+        root = self._plan(cls)
+        self._resolve_needs_path()
+        lines = []
+        for node in self._functions:
+            lines.extend(self._function(node))
+            lines.append('')
+        lines.append('def decode(data):')
+        lines.extend(self._assign(root, 'data', 'result', self.ref(self._root_path, 'root'), indent=1))
+        lines.append('    return result')
+        return '\n'.join(lines) + '\n'
+
+    def _plan(self, field_type: Any) -> _Node:
+        # Nodes are stored by type_key, since e.g. list[A | B] and list[B | A] are equal but don't generate the same code
+        key = type_key(field_type)
+        try:
+            return self._nodes[key]
+        except KeyError:
+            pass
+        except TypeError:  # Unhashable field_type
+            return _Node(kind='fallback', field_type=field_type, needs_path=True)
+
+        try:
+            parser: Parser | None = self.decoder.resolve(path=self._root_path, field_type=field_type)
+        except ValueError:
+            # Let the decoder raise the error (with the correct path) if this type is ever reached
+            parser = None
+        kind = self._kind(parser)
+        if parser is not None and not self.decoder.is_planned(field_type):
+            kind = 'fallback'  # The parser depends on the path, so the decoder picks it at runtime
+        if kind == 'union':
+            try:
+                get_union_schema(field_type)
+            except ValueError:  # An invalid Discriminator. Let the parser raise the error if it's reached
+                kind = 'fallback'
+        node = _Node(kind=kind, field_type=field_type, parser=parser)
+        self._nodes[key] = node
+        if node.kind not in INLINE_KINDS:
+            node.name = f'decode_{len(self._functions)}'
+            self._functions.append(node)
+        # Children are planned after the node is stored, so that recursive types refer back to it
+        node.children = [(key, self._plan(child_type)) for key, child_type in self._child_types(node)]
+        if node.kind == 'fallback':
+            node.needs_path = True
+        return node
+
+    def _kind(self, parser: Parser | None) -> str:
+        # Only the exact builtin parser classes are generated, since subclasses may behave differently
+        if returns_unchanged(parser):
+            return 'any' if getattr(parser, 'input_types', None) is None else 'check'
+        if isinstance(parser, UnionParser) and parser.adaptive:
+            return 'fallback'  # The order of the arms changes at runtime
+        kinds: dict[type, str] = {
+            PathParser: 'path',
+            LiteralParser: 'literal',
+            ListParser: 'list',
+            DictParser: 'dict',
+            TupleParser: 'tuple',
+            NamedTupleParser: 'namedtuple',
+            DataclassParser: 'dataclass',
+            TypedDictParser: 'typeddict',
+            ClassParser: 'class',
+            UnionParser: 'union',
+        }
+        return kinds.get(type(parser), 'fallback')
+
+    def _child_types(self, node: _Node) -> list[tuple[Any, Any]]:
+        field_type = node.field_type
+        match node.kind:
+            case 'list':
+                args = get_args(field_type)
+                return [(None, Any if len(args) == 0 else args[0])]
+            case 'dict':
+                args = get_args(field_type)
+                return list(enumerate(args if len(args) == 2 else (Any, Any)))
+            case 'tuple':
+                args = get_args(field_type)
+                if len(args) == 2 and args[1] is Ellipsis:
+                    return [(None, args[0])]
+                if len(args) == 0:
+                    return [(None, Any)]
+                return list(enumerate(args))
+            case 'namedtuple':
+                return list(get_named_tuple_fields(field_type))
+            case 'dataclass':
+                return [(f.name, f.type) for f in get_schema(field_type).fields]
+            case 'typeddict':
+                return list(get_typed_dict_schema(field_type).type_hints.items()) + [(None, Any)]
+            case 'class':
+                return [(p.name, p.annotation) for p in get_signature(field_type).parameters]
+            case 'union':
+                return list(enumerate(get_union_schema(field_type).arms))
+        return []
+
+    def _resolve_needs_path(self):
+        # A function needs the path if anything it (transitively) calls does. Repeat until stable, for recursive types
+        changed = True
+        while changed:
+            changed = False
+            for node in self._functions:
+                if not node.needs_path and any(child.needs_path for _, child in node.children):
+                    node.needs_path = changed = True
+
+    def _constructor(self, field_type: Any, builtin: type) -> str:
+        # list[int](items) is the same as list(items), and skips the generic alias
+        if field_type is builtin or (isinstance(field_type, GenericAlias) and get_origin(field_type) is builtin):
+            return builtin.__name__
+        return self.ref(field_type, 'cls')
+
+    def _assign(self, node: _Node, src: str, dst: str, path: str, indent: int) -> list[str]:
+        # Lines which parse the local variable src as node, into the local variable dst.
+        # path is an expression for the path of src, and is only evaluated when it's needed
+        pad = '    ' * indent
+        match node.kind:
+            case 'any':
+                return [f'{pad}{dst} = {src}']
+            case 'check':
+                checked_types = self._checked_types(node)
+                if checked_types == (type(None),):
+                    condition = f'{src} is not None'
+                elif len(checked_types) == 1:
+                    name = self.ref(checked_types[0], 'type')
+                    condition = f'type({src}) is not {name} and not isinstance({src}, {name})'
+                else:
+                    condition = f'not {self._isinstance(src, checked_types)}'
+                return [
+                    f'{pad}if {condition}:',
+                    f'{pad}    raise ValueError(f"Invalid type: {{type({src})}}")',
+                    f'{pad}{dst} = {src}',
+                ]
+            case 'path':
+                path_type = self.ref(Path, 'Path')
+                return [
+                    f'{pad}if not isinstance({src}, (str, {path_type})):',
+                    f'{pad}    raise ValueError(f"Invalid type: {{type({src})}}")',
+                    f'{pad}{dst} = {path_type}({src})',
+                ]
+            case 'literal':
+                return [
+                    f'{pad}for literal in {self.ref(get_args(node.field_type), "literals")}:',
+                    f'{pad}    if type({src}) is type(literal) and {src} == literal:',
+                    f'{pad}        break',
+                    f'{pad}else:',
+                    f'{pad}    raise ValueError(f"Invalid value: {{{src}!r}}")',
+                    f'{pad}{dst} = {src}',
+                ]
+            case 'fallback':
+                return [f'{pad}{dst} = {self._fallback(node, src, path)}']
+        if node.needs_path:
+            return [f'{pad}{dst} = {node.name}({src}, {path})']
+        return [f'{pad}{dst} = {node.name}({src})']
+
+    def _fallback(self, node: _Node, src: str, path: str) -> str:
+        field_type = self.ref(node.field_type, 'field_type')
+        decoder = self.ref(self.decoder, 'decoder')
+        if node.parser is None:
+            return f'{decoder}.subparse(path={path}, field_type={field_type}, data={src})'
+        parser = self.ref(node.parser, 'parser')
+        return f'{parser}.parse(path={path}, field_type={field_type}, data={src}, subparse={decoder})'
+
+    def _function(self, node: _Node) -> list[str]:
+        params = 'data, path' if node.needs_path else 'data'
+        lines = [f'def {node.name}({params}):']
+        body = getattr(self, f'_{node.kind}_body')(node)
+        lines.extend(f'    {line}' if line else line for line in body)
+        return lines
+
+    def _invalid_type(self, condition: str) -> list[str]:
+        return [f'if {condition}:', '    raise ValueError(f"Invalid type: {type(data)}")']
+
+    def _list_body(self, node: _Node) -> list[str]:
+        [(_, child)] = node.children
+        constructor = self._constructor(node.field_type, list)
+        borrow = getattr(node.parser, 'borrow', False) and constructor == 'list'
+        if borrow:
+            unchanged = 'data if type(data) is list else list(data)'
+        else:
+            unchanged = 'list(data)' if constructor == 'list' else f'{constructor}(list(data))'
+        lines = self._invalid_type(f'not isinstance(data, {self.ref(Sequence, "Sequence")})')
+        if child.kind == 'any':
+            return lines + [f'return {unchanged}']
+        if child.kind == 'check':
+            # Like ListParser, check every item in one pass, and only loop (to raise the error) if one is invalid
+            checked_types = self._checked_types(child)
+            checked_type = self.ref(checked_types[0] if len(checked_types) == 1 else checked_types, 'type')
+            lines += [
+                f'if all(map(isinstance, data, {self.ref(repeat, "repeat")}({checked_type}))):',
+                f'    return {unchanged}',
+            ]
+        if borrow:
+            # Like ListParser(borrow=True), only copy from the first item which parses to a different object
+            lines += ['items = None', 'for index, item in enumerate(data):']
+            lines += self._assign(child, 'item', 'value', 'path.child(index=index)', indent=1)
+            lines += [
+                '    if items is None:',
+                '        if value is item:',
+                '            continue',
+                f'        items = list({self.ref(islice, "islice")}(data, index))',
+                '    items.append(value)',
+                'if items is None:',
+                f'    return {unchanged}',
+                'return items',
+            ]
+            return lines
+        lines += ['items = []', 'append = items.append', 'for index, item in enumerate(data):']
+        lines += self._assign(child, 'item', 'value', 'path.child(index=index)', indent=1)
+        lines += ['    append(value)', 'return items' if constructor == 'list' else f'return {constructor}(items)']
+        return lines
+
+    def _tuple_body(self, node: _Node) -> list[str]:
+        constructor = self._constructor(node.field_type, tuple)
+        lines = self._invalid_type(f'not isinstance(data, {self.ref(Sequence, "Sequence")})')
+        if len(node.children) == 1 and node.children[0][0] is None:
+            [(_, child)] = node.children
+            lines += ['items = []', 'append = items.append', 'for index, item in enumerate(data):']
+            lines += self._assign(child, 'item', 'value', 'path.child(index=index)', indent=1)
+            lines += ['    append(value)', f'return {constructor}(items)']
+            return lines
+        lines += [f'if len(data) != {len(node.children)}:', '    raise ValueError(f"Invalid tuple length")']
+        for index, child in node.children:
+            lines.append(f'item = data[{index}]')
+            lines += self._assign(child, 'item', f'value_{index}', f'path.child(index={index})', indent=0)
+        values = ''.join(f'value_{index}, ' for index, _ in node.children).strip()
+        if constructor == 'tuple':
+            return lines + [f'return ({values})']
+        return lines + [f'return {constructor}(({values}))']
+
+    def _dict_body(self, node: _Node) -> list[str]:
+        [(_, key_node), (_, value_node)] = node.children
+        constructor = self._constructor(node.field_type, dict)
+        lines = self._invalid_type(f'not isinstance(data, {self.ref(Mapping, "Mapping")})')
+        borrow = getattr(node.parser, 'borrow', False) and constructor == 'dict'
+        if borrow:
+            lines += ['items = None', 'for index, (key, value) in enumerate(data.items()):']
+        else:
+            lines += ['items = {}', 'for key, value in data.items():']
+        if key_node.needs_path or value_node.needs_path:
+            lines.append('    child_path = path.child(name=str(key))')
+        lines += self._assign(key_node, 'key', 'parsed_key', 'child_path', indent=1)
+        lines += self._assign(value_node, 'value', 'parsed_value', 'child_path', indent=1)
+        if borrow:
+            # Like DictParser(borrow=True), only copy from the first entry which parses to different objects
+            lines += [
+                '    if items is None:',
+                '        if parsed_key is key and parsed_value is value:',
+                '            continue',
+                f'        items = dict({self.ref(islice, "islice")}(data.items(), index))',
+                '    items[parsed_key] = parsed_value',
+                'if items is None:',
+                '    return data if type(data) is dict else dict(data)',
+                'return items',
+            ]
+            return lines
+        lines.append('    items[parsed_key] = parsed_value')
+        lines.append('return items' if constructor == 'dict' else f'return {constructor}(items)')
+        return lines
+
+    def _namedtuple_body(self, node: _Node) -> list[str]:
+        constructor = self.ref(node.field_type, 'cls')
+        sequence = self.ref(Sequence, 'Sequence')
+        lines = self._invalid_type(
+            f'not isinstance(data, {sequence}) and not isinstance(data, {self.ref(Mapping, "Mapping")})'
+        )
+        lines += [f'if len(data) != {len(node.children)}:', '    raise ValueError(f"Invalid tuple length")']
+        lines.append(f'if isinstance(data, {sequence}):')
+        for index, (name, child) in enumerate(node.children):
+            lines.append(f'    item = data[{index}]')
+            lines += self._assign(child, 'item', f'value_{index}', f'path.child(index={index})', indent=1)
+        lines.append('else:')
+        for index, (name, child) in enumerate(node.children):
+            lines += [f'    if {name!r} not in data:', f'        raise ValueError("Missing field {name}")']
+            lines.append(f'    item = data[{name!r}]')
+            lines += self._assign(child, 'item', f'value_{index}', f'path.child(name={name!r})', indent=1)
+        arguments = ', '.join(f'{name}=value_{index}' for index, (name, _) in enumerate(node.children))
+        return lines + [f'return {constructor}({arguments})']
+
+    def _keyword_arguments(self, node: _Node, required: Callable[[str], bool], missing: str) -> list[str]:
+        # Parses the fields of a mapping into the kwargs dict, for dataclasses and classes
+        lines = []
+        for name, child in node.children:
+            lines += [f'if {name!r} in data:', f'    item = data[{name!r}]']
+            lines += self._assign(child, 'item', 'value', f'path.child(name={name!r})', indent=1)
+            lines.append(f'    kwargs[{name!r}] = value')
+            if required(name):
+                lines += ['else:', f'    raise ValueError("{missing}: {name}")']
+        return lines
+
+    def _dataclass_body(self, node: _Node) -> list[str]:
+        schema = get_schema(node.field_type)
+        names = self._frozenset(f.name for f in schema.fields)
+        lines = self._invalid_type(f'not isinstance(data, {self.ref(Mapping, "Mapping")})')
+        lines += [
+            f'field_names = {names}',
+            'if not field_names.issuperset(data.keys()):',
+            '    raise ValueError(f"Unknown keys: {frozenset(data.keys()) - field_names}")',
+            'kwargs = {}',
+        ]
+        if getattr(node.parser, 'trusted', False):
+            return lines + self._trusted_construction(node, schema)
+        lines += self._keyword_arguments(node, lambda name: name in schema.required, 'Missing required field')
+        return lines + [f'return {self.ref(node.field_type, "cls")}(**kwargs)']
+
+    def _trusted_construction(self, node: _Node, schema: DataclassSchema) -> list[str]:
+        # Like DataclassParser(trusted=True): no type checks for fields returned unchanged, and no __init__
+        fields = {field.name: field for field in schema.fields}
+        lines = []
+        for name, child in node.children:
+            lines += [f'if {name!r} in data:', f'    item = data[{name!r}]']
+            if child.kind in ('check', 'any'):
+                lines.append(f'    kwargs[{name!r}] = item')
+            else:
+                lines += self._assign(child, 'item', 'value', f'path.child(name={name!r})', indent=1)
+                lines.append(f'    kwargs[{name!r}] = value')
+            if fields[name].has_default:
+                lines += ['else:', f'    kwargs[{name!r}] = {self._default(fields[name])}']
+            else:
+                lines += ['else:', f'    raise ValueError("Missing required field: {name}")']
+        lines += [f'kwargs[{field.name!r}] = {self._default(field)}' for field in schema.other_defaults]
+        lines.append(f'instance = {self.ref(object.__new__, "new")}({self.ref(node.field_type, "cls")})')
+        if schema.uses_dict:
+            lines.append('instance.__dict__.update(kwargs)')
+        else:
+            setattr_ = self.ref(object.__setattr__, 'setattr')
+            lines += ['for name, value in kwargs.items():', f'    {setattr_}(instance, name, value)']
+        return lines + ['return instance']
+
+    def _default(self, field: DataclassField) -> str:
+        if field.default is not dataclasses.MISSING:
+            return self.ref(field.default, 'default')
+        return f'{self.ref(field.default_factory, "factory")}()'
+
+    def _class_body(self, node: _Node) -> list[str]:
+        signature = get_signature(node.field_type)
+        required = {p.name for p in signature.parameters if p.required}
+        lines = self._invalid_type(f'not isinstance(data, {self.ref(Mapping, "Mapping")})')
+        lines.append('kwargs = dict(data.items())' if signature.accepts_kwargs else 'kwargs = {}')
+        lines += self._keyword_arguments(node, lambda name: name in required, 'Missing required parameter')
+        return lines + [f'return {self.ref(node.field_type, "cls")}(**kwargs)']
+
+    def _typeddict_body(self, node: _Node) -> list[str]:
+        schema = get_typed_dict_schema(node.field_type)
+        known = schema.required_keys | schema.optional_keys
+        lines = self._invalid_type(f'not isinstance(data, {self.ref(Mapping, "Mapping")})')
+        lines += [
+            f'required_keys = {self._frozenset(schema.required_keys)}',
+            'if any(key not in data for key in required_keys):',
+            '    raise ValueError(f"Missing required keys: {required_keys - frozenset(data.keys())}")',
+            'kwargs = {}',
+            'for key, value in data.items():',
+        ]
+        named = [(name, child) for name, child in node.children if name is not None]
+        [unknown] = [child for name, child in node.children if name is None]
+        for i, (name, child) in enumerate(named):
+            lines.append(f'    {"if" if i == 0 else "elif"} key == {name!r}:')
+            lines += self._assign(child, 'value', 'parsed', 'path.child(name=str(key))', indent=2)
+        indent = 1
+        if len(named) > 0:
+            lines.append('    else:')
+            indent = 2
+        pad = '    ' * indent
+        if not schema.allow_unknown_keys:
+            lines += [
+                f'{pad}if key not in {self._frozenset(known)}:',
+                f'{pad}    raise ValueError(f"Unknown key: {{key}}")',
+            ]
+        lines += self._assign(unknown, 'value', 'parsed', 'path.child(name=str(key))', indent=indent)
+        lines += ['    kwargs[key] = parsed', f'return {self.ref(node.field_type, "cls")}(**kwargs)']
+        return lines
+
+    def _union_body(self, node: _Node) -> list[str]:
+        lines = self._discriminator(node)
+        # Like UnionParser, arms which can't accept the runtime type of data are skipped without raising
+        for _, child in node.children:
+            if child.kind == 'check':
+                # The check is the whole parser, so it can't fail once the guard passed
+                lines += [f'if {self._isinstance("data", self._checked_types(child))}:', '    return data']
+                continue
+            input_types = getattr(child.parser, 'input_types', None)
+            indent = 0
+            if input_types is not None:
+                lines.append(f'if {self._isinstance("data", input_types)}:')
+                indent = 1
+            pad = '    ' * indent
+            lines.append(f'{pad}try:')
+            lines += self._assign(child, 'data', 'result', 'path', indent=indent + 1)
+            lines += [f'{pad}    return result', f'{pad}except ValueError:', f'{pad}    pass']
+        return lines + ['raise ValueError(f"Invalid type: {type(data)}")']
+
+    def _discriminator(self, node: _Node) -> list[str]:
+        # Jumps straight to the arm for the tag, like UnionParser
+        schema = get_union_schema(node.field_type)
+        if schema.discriminator is None:
+            return []
+        tags = {tag: schema.arms.index(arm) for tag, arm in schema.tags.items()}
+        lines = [
+            f'if isinstance(data, {self.ref(Mapping, "Mapping")}):',
+            f'    key = {schema.discriminator!r}',
+            '    if key in data:',
+            '        tag = data[key]',
+            '        try:',
+            f'            arm = {self.ref(tags, "tags")}[(type(tag), tag)]',
+            '        except (KeyError, TypeError):',
+            '            raise ValueError(f"Invalid {key}: {tag!r}")',
+        ]
+        for index, child in node.children:
+            if index not in tags.values():
+                continue
+            lines.append(f'        if arm == {index}:')
+            lines += self._assign(child, 'data', 'result', 'path', indent=3)
+            lines.append('            return result')
+        if schema.requires_discriminator:
+            lines.append('    raise ValueError(f"Missing discriminator: {key}")')
+        return lines
+
+    def _checked_types(self, node: _Node) -> tuple[type, ...]:
+        # The types a 'check' node's parser returns unchanged
+        return getattr(node.parser, 'input_types')
+
+    def _isinstance(self, src: str, types: tuple[type, ...]) -> str:
+        if types == (type(None),):
+            return f'{src} is None'
+        names = [self.ref(t, t.__name__) for t in types]
+        return f'isinstance({src}, {names[0] if len(names) == 1 else "(" + ", ".join(names) + ")"})'
+
+    def _frozenset(self, values: Iterable[str]) -> str:
+        # Sorted, so that the generated source is the same every time
+        return f'frozenset({tuple(sorted(values))!r})'
+
+
+class _ModuleGenerator(_Generator):
+    # Generates a standalone module, which refers to everything it needs through imports instead of a namespace.
+    # It always uses the default parsers
+    def __init__(self):
+        super().__init__(DEFAULT_DECODER)
+        self.imports: set[str] = set()
+        self.assignments: list[str] = []
+
+    def ref(self, obj: Any, hint: str = 'ref') -> str:
+        if id(obj) not in self._refs:
+            self.assignments.append(f'{hint}_{len(self._refs)} = {self._expression(obj)}')
+        return super().ref(obj, hint)
+
+    def _fallback(self, node: _Node, src: str, path: str) -> str:
+        # Parsers can't be imported by name, so let the default decoder find them again
+        field_type = self.ref(node.field_type, 'field_type')
+        return f'{self.ref(self.decoder, "decoder")}.subparse(path={path}, field_type={field_type}, data={src})'
+
+    def _expression(self, obj: Any) -> str:
+        if obj is None or obj is Ellipsis or isinstance(obj, (str, int, float, bool, bytes)):
+            return repr(obj)
+        if obj is type(None):
+            return 'type(None)'
+        if type(obj) is tuple:
+            return f"({', '.join(self._expression(item) for item in obj)}{',' if len(obj) == 1 else ''})"
+        if type(obj) is dict:
+            return f"{{{', '.join(f'{self._expression(k)}: {self._expression(v)}' for k, v in obj.items())}}}"
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):  # e.g. Discriminator('kind')
+            fields = ', '.join(f'{f.name}={self._expression(getattr(obj, f.name))}' for f in dataclasses.fields(obj))
+            return f'{self._expression(type(obj))}({fields})'
+        if obj is DEFAULT_DECODER:
+            # dict2any.parse is shadowed by the parse function, once dict2any is imported
+            self.imports.add('from dict2any.parse import DEFAULT_DECODER')
+            return 'DEFAULT_DECODER'
+        if obj == self._root_path:
+            return f"{self._import('dict2any.jq_path', 'JqPath')}.parse('.')"
+        name = getattr(obj, '_name', None)
+        if name is not None and getattr(typing, name, None) is obj:
+            return self._import('typing', name)  # Special forms, such as Any or Union
+
+        origin = get_origin(obj)
+        if origin is Annotated:
+            args = [obj.__origin__, *obj.__metadata__]
+            return f"{self._import('typing', 'Annotated')}[{', '.join(self._expression(arg) for arg in args)}]"
+        if origin is UnionType:
+            return ' | '.join(self._expression(arg) for arg in get_args(obj))
+        if origin is not None:
+            origin_expression: str
+            if origin is Union or origin is Literal:
+                origin_expression = self._import('typing', getattr(origin, '_name'))
+            else:
+                # e.g. typing.List[int] is written as list[int], which is the same type to every parser
+                origin_expression = self._expression(origin)
+            arg_expressions = ', '.join(self._expression(arg) for arg in get_args(obj))
+            return f'{origin_expression}[{arg_expressions}]'
+
+        module = getattr(obj, '__module__', None)
+        qualname = getattr(obj, '__qualname__', None)
+        if module is None or qualname is None or '<locals>' in qualname:
+            raise ValueError(f"{obj!r} can't be imported from a generated module")
+        return self._import(module, qualname)
+
+    def _import(self, module: str, qualname: str) -> str:
+        if module == 'builtins':
+            return qualname
+        self.imports.add(f'import {module}')
+        return f'{module}.{qualname}'
+
+    def generate_module(self, cls: Any, command: str) -> str:
+        body = self.generate(cls)
+        header = [
+            f'# Generated by `{command}`. Do not edit',
+            '# Run it again to regenerate this file, or with --check to check that this file is up to date',
+        ]
+        imports = sorted(self.imports)
+        return '\n'.join(header + [''] + imports + [''] + self.assignments + ['', '']) + body
+
+
+_compiled: weakref.WeakKeyDictionary[Decoder, dict[Any, Callable[[Any], Any]]] = weakref.WeakKeyDictionary()
+
+
+def generate_source(cls: Any, parsers: Iterable[Parser] | None = None) -> tuple[str, dict[str, Any]]:
+    # Returns the generated python source for decoding cls, and the namespace it has to be executed in.
+    # The source defines decode(data)
+    generator = _Generator(_get_decoder(parsers))
+    source = generator.generate(cls)
+    return source, generator.namespace
+
+
+def generate_module(cls: Any, command: str) -> str:
+    # Returns the source of a standalone module, which defines decode(data) for cls using the default parsers.
+    # Importing it doesn't introspect any types
+    return _ModuleGenerator().generate_module(cls, command)
+
+
+def compile_decoder(cls: Type[T], parsers: Iterable[Parser] | None = None) -> Callable[[Any], T]:
+    # Returns a function which parses data as cls, the same as parse(cls, data, parsers), but using generated code.
+    # The function is cached per type (by type_key) and set of parsers
+    decoder = _get_decoder(parsers)
+    cache = _compiled.setdefault(decoder, {})
+    key = type_key(cls)
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+    except TypeError:  # Unhashable cls
+        return _compile(cls, decoder)
+    compiled = cache[key] = _compile(cls, decoder)
+    return compiled
+
+
+def _compile(cls: Any, decoder: Decoder) -> Callable[[Any], Any]:
+    generator = _Generator(decoder)
+    source = generator.generate(cls)
+    namespace = generator.namespace
+    exec(compile(source, f'<dict2any decoder for {cls!r}>', 'exec'), namespace)
+    return namespace['decode']
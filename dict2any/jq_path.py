@@ -1,65 +1,158 @@
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
-ARRAY_REGEX = re.compile(r'\.?\[(\d)+\]')
-FIND_WITHIN_QUOTES = r'(?:[^".\n\[\]]*(?:\\")*?)*?'
-DICT_REGEX = re.compile(r'\.("{}"|{})(?=\.|$|\[)'.format(FIND_WITHIN_QUOTES, FIND_WITHIN_QUOTES))
+# Every part of a path is one of: [index] (optionally preceded by a dot), .name, or ."quoted name"
+# Quoted names can contain any character, with " and \ escaped by a backslash
+NAME_CHARACTERS = r'[^".\[\]\n]+'
+TOKEN_REGEX = re.compile(r'\.?\[(\d+)\]|\.({})|\."((?:[^"\\]|\\.)*)"'.format(NAME_CHARACTERS), re.DOTALL)
+NAME_REGEX = re.compile(NAME_CHARACTERS)
+UNESCAPE_REGEX = re.compile(r'\\(.)', re.DOTALL)
+ESCAPE_REGEX = re.compile(r'(["\\])')
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JqPathPart:
     name: str | None = None
     index: int | None = None
 
     def __str__(self):
-        return self.name if self.index is None else f'[{self.index}]'
+        if self.index is not None:
+            return f'[{self.index}]'
+        assert self.name is not None
+        if NAME_REGEX.fullmatch(self.name):
+            return self.name
+        return '"{}"'.format(ESCAPE_REGEX.sub(r'\\\1', self.name))
 
     def __post_init__(self):
         if (self.name is None) == (self.index is None):
             raise ValueError("Either name or index must be set")
 
+    @classmethod
+    def of(cls, *, name: str | None = None, index: int | None = None) -> 'JqPathPart':
+        # Parts are immutable, so the common ones are shared instead of allocating a new part for every node
+        if index is not None and name is None and 0 <= index < len(_INDEX_PARTS):
+            return _INDEX_PARTS[index]
+        if name is not None and index is None:
+            return _name_part(name)
+        return cls(name=name, index=index)
+
+
+_INDEX_PARTS = tuple(JqPathPart(index=i) for i in range(1024))
+
+
+@lru_cache(maxsize=4096)
+def _name_part(name: str) -> JqPathPart:
+    return JqPathPart(name=name)
+
 
-@dataclass(frozen=True)
 class JqPath:
-    parts: tuple[JqPathPart, ...]
+    # Each path only stores its last part, and a link to its parent path, so paths share their common prefixes.
+    # That makes child() O(1), which matters since it's called for every node that gets parsed. The full tuple of parts
+    # is only built when it's asked for (e.g. when a path ends up in an error message)
+    __slots__ = ('_parent', '_part', '_depth', '_hash')
+    _parent: 'JqPath | None'
+    _part: JqPathPart
+    _depth: int
+    _hash: int | None
 
-    def __post_init__(self):
-        if len(self.parts) == 0:
+    def __init__(self, parts: tuple[JqPathPart, ...]):
+        if len(parts) == 0:
             raise ValueError("Path must have at least one part")
+        parent = None
+        for part in parts[:-1]:
+            parent = JqPath._link(parent, part)
+        self._parent = parent
+        self._part = parts[-1]
+        self._depth = len(parts)
+        self._hash = None
+
+    @staticmethod
+    def _link(parent: 'JqPath | None', part: JqPathPart) -> 'JqPath':
+        path = object.__new__(JqPath)
+        path._parent = parent
+        path._part = part
+        path._depth = 1 if parent is None else parent._depth + 1
+        path._hash = None
+        return path
+
+    @property
+    def parts(self) -> tuple[JqPathPart, ...]:
+        parts = []
+        node: JqPath | None = self
+        while node is not None:
+            parts.append(node._part)
+            node = node._parent
+        parts.reverse()
+        return tuple(parts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, JqPath):
+            return NotImplemented
+        if self._depth != other._depth:
+            return False
+        left: JqPath | None = self
+        right: JqPath | None = other
+        # Stop as soon as both sides share the same prefix
+        while left is not right:
+            assert left is not None and right is not None
+            if left._part != right._part:
+                return False
+            left, right = left._parent, right._parent
+        return True
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            # Computed iteratively from the first ancestor with a cached hash, to avoid recursing on deep paths
+            pending: list[JqPath] = []
+            node: JqPath | None = self
+            while node is not None and node._hash is None:
+                pending.append(node)
+                node = node._parent
+            parent_hash = None if node is None else node._hash
+            for node in reversed(pending):
+                node._hash = parent_hash = hash((parent_hash, node._part))
+        assert self._hash is not None
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f'JqPath(parts={self.parts!r})'
 
     @classmethod
     def parse(cls, path: str) -> 'JqPath':
-        if path == "" or path == ".":
-            return cls(parts=(JqPathPart(name=""),))
-
-        jq_parts = [JqPathPart(name="")]
-        while len(path) > 0:
-            match = ARRAY_REGEX.match(path)
-            if match is not None:
-                jq_parts.append(JqPathPart(index=int(match.group(1))))
-                path = path[match.end() :]
-                continue
-
-            match = DICT_REGEX.match(path)
-            if match is not None:
-                name = match.group(1)
-                if len(name) == 0:
-                    raise ValueError(f"Invalid path: {path}")
-                jq_parts.append(JqPathPart(name=match.group(1)))
-                path = path[match.end() :]
-                continue
-
-            raise ValueError(f"Invalid path: {path}")
-        return cls(parts=tuple(jq_parts))
+        return _parse(path)
 
     def path(self):
-        if len(self.parts) == 1:
+        if self._parent is None:
             return '.'
         return ''.join([f'.{part}' for part in self.parts[1:]])
 
     def parent(self) -> 'JqPath | None':
-        return JqPath(parts=self.parts[:-1]) if len(self.parts) > 1 else None
+        return self._parent
 
     def child(self, *, name: str | None = None, index: int | None = None) -> 'JqPath':
-        return JqPath(parts=self.parts + (JqPathPart(name=name, index=index),))
+        return JqPath._link(self, JqPathPart.of(name=name, index=index))
+
+
+@lru_cache(maxsize=1024)
+def _parse(path: str) -> JqPath:
+    # Paths are immutable, so the same selector strings (e.g. from a config file) are only tokenized once
+    if path == "" or path == ".":
+        return JqPath(parts=(JqPathPart.of(name=""),))
+
+    jq_parts = [JqPathPart.of(name="")]
+    position = 0
+    while position < len(path):
+        match = TOKEN_REGEX.match(path, position)
+        if match is None:
+            raise ValueError(f"Invalid path: {path}")
+        index, name, quoted_name = match.groups()
+        if index is not None:
+            jq_parts.append(JqPathPart.of(index=int(index)))
+        elif name is not None:
+            jq_parts.append(JqPathPart.of(name=name))
+        else:
+            jq_parts.append(JqPathPart.of(name=UNESCAPE_REGEX.sub(r'\1', quoted_name)))
+        position = match.end()
+    return JqPath(parts=tuple(jq_parts))
@@ -0,0 +1,171 @@
+import codecs
+import json
+from collections.abc import Iterable, Iterator
+from typing import IO, Any, Type, TypeVar
+
+from dict2any.jq_path import JqPath
+from dict2any.parse import _get_decoder
+from dict2any.parsers import Parser
+
+T = TypeVar('T')
+
+WHITESPACE = ' \t\n\r'
+DELIMITERS = tuple(',:]}' + WHITESPACE)
+
+
+class _Reader:
+    # A minimal incremental JSON reader. Only the value currently being read (plus one chunk) is kept in the buffer,
+    # everything before it is dropped as the reader moves forwards
+    def __init__(self, stream: IO[str] | IO[bytes], chunk_size: int):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder: codecs.IncrementalDecoder | None = None
+        self._json = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        # Read at least as much as is already buffered, so that re-scanning a large value stays linear overall
+        chunk = self._stream.read(max(self._chunk_size, len(self.buffer) - self.pos))
+        if isinstance(chunk, bytes):
+            if self._decoder is None:
+                self._decoder = codecs.getincrementaldecoder('utf-8-sig')()
+            text = self._decoder.decode(chunk, final=len(chunk) == 0)
+        else:
+            text = chunk
+        if len(chunk) == 0:
+            self.eof = True
+        self.buffer = self.buffer[self.pos :] + text
+        self.pos = 0
+        return len(chunk) > 0
+
+    def peek(self) -> str:
+        # Returns the next non-whitespace character without consuming it, or '' at the end of the stream
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Invalid JSON: expected {char!r} but found {found or 'the end of the stream'!r}")
+        self.pos += 1
+
+    def read_value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                # Either the value is incomplete, or it's invalid. There's no way to tell until the stream ends
+                if not self._fill():
+                    raise ValueError(f"Invalid JSON: {e}") from e
+                continue
+            # A number can look complete when it's cut off at the end of the buffer, e.g. 12 out of 123, or 2 out of 2.5
+            # (where only the "2." has been read so far). Any such leftover is at most 2 characters, like "e-"
+            if len(self.buffer) - end <= 2 and self.buffer[end : end + 1] not in DELIMITERS and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def skip_value(self):
+        if self.peek() not in ('{', '['):
+            self.read_value()
+            return
+        depth = 0
+        in_string = False
+        escaped = False
+        while True:
+            if self.pos >= len(self.buffer) and not self._fill():
+                raise ValueError("Invalid JSON: unexpected end of the stream")
+            char = self.buffer[self.pos]
+            self.pos += 1
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == '\\':
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char in '{[':
+                depth += 1
+            elif char in '}]':
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def next_item(self, close: str, first: bool) -> bool:
+        # Moves to the next item of the current object or array. Returns False once the closing character is reached
+        if self.peek() == close:
+            self.pos += 1
+            return False
+        if not first:
+            self.expect(',')
+        return True
+
+
+def iter_json_array(stream: IO[str] | IO[bytes], path: JqPath | str = '.', chunk_size: int = 65536) -> Iterator[Any]:
+    # Yields the elements of the array at path (by default, the top-level array) one at a time,
+    # without reading the whole document into memory
+    jq_path = JqPath.parse(path) if isinstance(path, str) else path
+    reader = _Reader(stream, chunk_size)
+    for part in jq_path.parts[1:]:
+        if part.index is None:
+            _find_key(reader, jq_path, part.name)
+        else:
+            _find_index(reader, jq_path, part.index)
+
+    reader.expect('[')
+    first = True
+    while reader.next_item(']', first):
+        first = False
+        yield reader.read_value()
+
+
+def iter_parse_json_array(
+    cls: Type[T],
+    stream: IO[str] | IO[bytes],
+    path: JqPath | str = '.',
+    parsers: Iterable[Parser] | None = None,
+) -> Iterator[T]:
+    # Yields each element of the array at path, parsed as cls (the element type, e.g. Package for a list[Package])
+    jq_path = JqPath.parse(path) if isinstance(path, str) else path
+    decoder = _get_decoder(parsers)
+    parser = decoder.resolve(path=jq_path, field_type=cls)
+    for index, data in enumerate(iter_json_array(stream, jq_path)):
+        yield parser.parse(path=jq_path.child(index=index), field_type=cls, data=data, subparse=decoder)
+
+
+def _find_key(reader: _Reader, path: JqPath, name: str | None):
+    reader.expect('{')
+    first = True
+    while reader.next_item('}', first):
+        first = False
+        key = reader.read_value()
+        reader.expect(':')
+        if key == name:
+            return
+        reader.skip_value()
+    raise ValueError(f"Path not found: {path.path()}")
+
+
+def _find_index(reader: _Reader, path: JqPath, index: int):
+    reader.expect('[')
+    first = True
+    i = 0
+    while reader.next_item(']', first):
+        first = False
+        if i == index:
+            return
+        reader.skip_value()
+        i += 1
+    raise ValueError(f"Path not found: {path.path()}")
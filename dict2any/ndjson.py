@@ -0,0 +1,147 @@
+import json
+import mmap
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import IO, Any, Type, TypeVar, overload
+
+from dict2any import parallel
+from dict2any.parse import _get_decoder
+from dict2any.parsers import Parser
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+Source = str | os.PathLike | IO[bytes] | IO[str]
+
+
+def iter_parse_ndjson(cls: Type[T], source: Source, parsers: Iterable[Parser] | None = None) -> Iterator[T]:
+    # Reads a JSON lines file (or stream) one line at a time, and yields each record parsed as cls. Only one line is
+    # held in memory at a time. Blank lines are skipped, and the nth record is parsed at the path .[n]
+    return _get_decoder(parsers).iter_parse(cls, _read_records(source))
+
+
+def iter_parse_ndjson_batches(
+    cls: Type[T], source: Source, parsers: Iterable[Parser] | None = None, *, batch_size: int = 1000
+) -> Iterator[list[T]]:
+    if batch_size < 1:
+        raise ValueError(f"Invalid batch_size: {batch_size}")
+    parsed = iter_parse_ndjson(cls, source, parsers)
+    while batch := list(islice(parsed, batch_size)):
+        yield batch
+
+
+def _read_records(source: Source) -> Iterator[Any]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            yield from _read_lines(f)
+    else:
+        yield from _read_lines(source)
+
+
+def _read_lines(lines: Iterable[bytes | str]) -> Iterator[Any]:
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON on line {line_number}: {e}") from e
+
+
+@overload
+def parse_ndjson_parallel(
+    cls: Type[T],
+    path: str | os.PathLike,
+    parsers: Iterable[Parser] | None = None,
+    *,
+    max_workers: int | None = None,
+    chunk_bytes: int | None = None,
+    reducer: None = None,
+) -> list[T]: ...
+
+
+@overload
+def parse_ndjson_parallel(
+    cls: Type[T],
+    path: str | os.PathLike,
+    parsers: Iterable[Parser] | None = None,
+    *,
+    max_workers: int | None = None,
+    chunk_bytes: int | None = None,
+    reducer: Callable[[Iterator[T]], R],
+) -> list[R]: ...
+
+
+def parse_ndjson_parallel(
+    cls: Type[T],
+    path: str | os.PathLike,
+    parsers: Iterable[Parser] | None = None,
+    *,
+    max_workers: int | None = None,
+    chunk_bytes: int | None = None,
+    reducer: Callable[[Iterator[T]], R] | None = None,
+) -> list[T] | list[R]:
+    # Splits the file into byte ranges which end on a newline, and has a pool of processes parse each range.
+    # Every worker memory-maps the file and only reads its own range, so the parent never reads the whole file.
+    # Without a reducer, all the records are returned in file order. With one, reducer(iterator of records) is called
+    # in the worker for each range, and the list of its (picklable) results is returned in file order instead
+    max_workers = max_workers or os.cpu_count() or 1
+    ranges = _split_ranges(path, chunk_bytes, max_workers)
+    if len(ranges) == 0:
+        return []
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=parallel.init_worker,
+        initargs=(cls, None if parsers is None else tuple(parsers)),
+    ) as executor:
+        futures = [executor.submit(_parse_range, path, start, end, reducer) for start, end in ranges]
+        results: list[Any] = [future.result() for future in futures]
+    if reducer is not None:
+        return results
+    return [record for range_records in results for record in range_records]
+
+
+def _split_ranges(path: str | os.PathLike, chunk_bytes: int | None, max_workers: int) -> list[tuple[int, int]]:
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return []
+        if chunk_bytes is None:
+            # A few ranges per worker, so that a slow range doesn't leave the other workers idle
+            chunk_bytes = max(1, -(-size // (max_workers * 4)))
+        if chunk_bytes < 1:
+            raise ValueError(f"Invalid chunk_bytes: {chunk_bytes}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            ranges = []
+            start = 0
+            while start < size:
+                newline = mapped.find(b'\n', min(start + chunk_bytes, size) - 1)
+                end = size if newline == -1 else newline + 1
+                ranges.append((start, end))
+                start = end
+            return ranges
+
+
+def _parse_range(
+    path: str | os.PathLike, start: int, end: int, reducer: Callable[[Iterator[Any]], Any] | None
+) -> list[Any] | Any:
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        records = _parse_mapped_lines(mapped, start, end)
+        return list(records) if reducer is None else reducer(records)
+
+
+def _parse_mapped_lines(mapped: mmap.mmap, start: int, end: int) -> Iterator[Any]:
+    position = start
+    while position < end:
+        newline = mapped.find(b'\n', position, end)
+        line_end = end if newline == -1 else newline
+        line = mapped[position:line_end]
+        if line.strip():
+            try:
+                yield parallel.worker_parse(json.loads(line))
+            except ValueError as e:
+                raise ValueError(f"Invalid record at byte offset {position}: {e}") from e
+        position = line_end + 1
@@ -0,0 +1,135 @@
+import math
+import os
+import time
+import warnings
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Generic, Type, TypeVar
+
+from dict2any.parse import Decoder, _get_decoder
+from dict2any.parsers import Parser
+
+T = TypeVar('T')
+
+
+class ParallelOverheadWarning(RuntimeWarning):
+    pass
+
+
+@dataclass(frozen=True)
+class ParallelStats:
+    items: int
+    chunks: int
+    chunk_size: int
+    # Seconds the whole batch took, as seen by the caller
+    wall_time: float
+    # Seconds the workers spent decoding, summed over all chunks. Roughly how long decoding serially would take
+    decode_time: float
+
+    @property
+    def speedup(self) -> float:
+        return self.decode_time / self.wall_time if self.wall_time > 0 else 0.0
+
+    @property
+    def overhead_dominates(self) -> bool:
+        # Sending the chunks to the workers and the results back took longer than decoding them would have
+        return self.wall_time >= self.decode_time
+
+
+# Each worker process keeps its own decoder for the lifetime of the pool, so the plan only has to be built once per
+# worker, instead of once per chunk
+_worker_decoder: Decoder | None = None
+_worker_cls: Any = None
+
+
+def init_worker(cls: Any, parsers: Iterable[Parser] | None):
+    # The initializer for a pool whose workers decode into cls, e.g. ProcessPoolExecutor(initializer=init_worker,
+    # initargs=(cls, parsers)). Tasks in the pool then call worker_parse
+    global _worker_decoder, _worker_cls
+    _worker_decoder = _get_decoder(parsers)
+    _worker_cls = cls
+
+
+def worker_parse(data: Any) -> Any:
+    # Parses data as the pool's cls, with the worker's decoder
+    if _worker_decoder is None:
+        raise RuntimeError("worker_parse can only be called in a pool started with init_worker")
+    return _worker_decoder.parse(_worker_cls, data)
+
+
+def _parse_chunk(start: int, chunk: Sequence[Any]) -> tuple[list[Any], float]:
+    assert _worker_decoder is not None
+    started = time.perf_counter()
+    results = _worker_decoder.parse_many(_worker_cls, chunk, start=start)
+    return results, time.perf_counter() - started
+
+
+class ParallelDecoder(Generic[T]):
+    # Decodes large batches of items into cls across a pool of processes. cls, the parsers, and the items must all be
+    # picklable. The pool is kept alive between calls to parse_many, so use it as a context manager (or call close)
+    def __init__(self, cls: Type[T], parsers: Iterable[Parser] | None = None, max_workers: int | None = None):
+        self.cls = cls
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.last_stats: ParallelStats | None = None
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=init_worker,
+            initargs=(cls, None if parsers is None else tuple(parsers)),
+        )
+
+    def __enter__(self) -> 'ParallelDecoder[T]':
+        return self
+
+    def __exit__(self, *args: Any):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown()
+
+    def parse_many(self, items: Sequence[Any], chunk_size: int | None = None) -> list[T]:
+        if chunk_size is None:
+            # A few chunks per worker, so that a slow chunk doesn't leave the other workers idle
+            chunk_size = max(1, math.ceil(len(items) / (self.max_workers * 4)))
+        if chunk_size < 1:
+            raise ValueError(f"Invalid chunk_size: {chunk_size}")
+
+        started = time.perf_counter()
+        starts = range(0, len(items), chunk_size)
+        chunks = (items[start : start + chunk_size] for start in starts)
+        results: list[T] = []
+        decode_time = 0.0
+        # map() returns the chunks in the order they were submitted
+        for chunk_results, chunk_time in self._executor.map(_parse_chunk, starts, chunks):
+            results.extend(chunk_results)
+            decode_time += chunk_time
+
+        stats = ParallelStats(
+            items=len(items),
+            chunks=len(starts),
+            chunk_size=chunk_size,
+            wall_time=time.perf_counter() - started,
+            decode_time=decode_time,
+        )
+        self.last_stats = stats
+        if len(items) > 0 and stats.overhead_dominates:
+            warnings.warn(
+                f"Parallel decoding of {stats.items} items in {stats.chunks} chunks of {stats.chunk_size} took "
+                f"{stats.wall_time:.3f}s, but only {stats.decode_time:.3f}s was spent decoding. "
+                "Decoding serially, or using larger chunks, is likely faster",
+                ParallelOverheadWarning,
+                stacklevel=2,
+            )
+        return results
+
+
+def parse_parallel(
+    cls: Type[T],
+    items: Sequence[Any],
+    parsers: Iterable[Parser] | None = None,
+    *,
+    chunk_size: int | None = None,
+    max_workers: int | None = None,
+) -> list[T]:
+    with ParallelDecoder(cls, parsers=parsers, max_workers=max_workers) as decoder:
+        return decoder.parse_many(items, chunk_size=chunk_size)
@@ -1,10 +1,12 @@
-from collections.abc import Sequence
-from random import shuffle
-from typing import Any, Type, TypeVar
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Type, TypeVar, get_origin
 
 from dict2any.jq_path import JqPath
 from dict2any.parsers import (
     AnyParser,
+    ArrayParser,
     BoolParser,
     ClassParser,
     DataclassParser,
@@ -12,8 +14,10 @@ from dict2any.parsers import (
     FloatParser,
     IntParser,
     ListParser,
+    LiteralParser,
     NamedTupleParser,
     NoneParser,
+    NumpyArrayParser,
     Parser,
     PathParser,
     Stage,
@@ -35,6 +39,9 @@ DEFAULT_PARSERS = frozenset(
         DictParser(),
         TypedDictParser(),
         ListParser(),
+        ArrayParser(),
+        NumpyArrayParser(),
+        LiteralParser(),
         PathParser(),
         NamedTupleParser(),
         TupleParser(),
@@ -44,18 +51,167 @@ DEFAULT_PARSERS = frozenset(
 )
 
 
+def default_parsers(*replacements: Parser) -> list[Parser]:
+    # The default parsers, with each one replaced by the replacement which is an instance of its class, e.g.
+    # default_parsers(ListParser(borrow=True)) to configure one of the builtin parsers
+    for replacement in replacements:
+        if not any(isinstance(replacement, type(parser)) for parser in DEFAULT_PARSERS):
+            raise ValueError(f"{replacement!r} doesn't replace any of the default parsers")
+    return [next((r for r in replacements if isinstance(r, type(parser))), parser) for parser in DEFAULT_PARSERS]
+
+
 T = TypeVar('T')
 
+STAGES = (Stage.Override, Stage.Exact, Stage.Fallback, Stage.LastChance)
+
+
+@dataclass(frozen=True)
+class _StageTable:
+    stage: Stage
+    # Parsers which declared the exact types, or typing origins they handle in this stage
+    types: dict[Any, Parser]
+    origins: dict[Any, Parser]
+    # Everything else taking part in this stage, which has to be asked via can_parse
+    parsers: tuple[Parser, ...]
+    # Whether any of those parsers set path_dependent, in which case the parser found in (or after) this stage can't
+    # be stored in the plan
+    path_dependent: bool
+
+    @classmethod
+    def build(cls, stage: Stage, parsers: Iterable[Parser]) -> '_StageTable':
+        types: dict[Any, Parser] = {}
+        origins: dict[Any, Parser] = {}
+        predicate_parsers: list[Parser] = []
+        for parser in parsers:
+            if stage not in getattr(parser, 'stages', STAGES):
+                continue
+            dispatch_types = getattr(parser, 'dispatch_types', {}).get(stage)
+            dispatch_origins = getattr(parser, 'dispatch_origins', {}).get(stage)
+            if dispatch_types is None and dispatch_origins is None:
+                predicate_parsers.append(parser)
+                continue
+            for table, keys in ((types, dispatch_types), (origins, dispatch_origins)):
+                for key in keys or ():
+                    if key in table:
+                        raise ValueError(f'Ambiguous parsers {[table[key], parser]} for {key} in stage {stage}')
+                    table[key] = parser
+        return cls(
+            stage=stage,
+            types=types,
+            origins=origins,
+            parsers=tuple(predicate_parsers),
+            path_dependent=any(getattr(parser, 'path_dependent', False) for parser in predicate_parsers),
+        )
+
+    def lookup(self, field_type: type) -> Parser | None:
+        try:
+            parser = self.types.get(field_type)
+        except TypeError:  # Unhashable field_type
+            return None
+        if parser is None and self.origins:
+            origin = get_origin(field_type)
+            parser = None if origin is None else self.origins.get(origin)
+        return parser
+
+
+class Decoder:
+    # The parsers are bucketed by stage once, here. Parsers which declare the types they handle (see Parser) are found
+    # with a dict lookup, and only the remaining ones are asked via can_parse.
+    # The parser chosen for a field_type doesn't depend on the data, so it's resolved the first time the type is seen
+    # and stored in the plan. Every later node of the same type is a dict lookup. The exception is a type which was
+    # offered to a path_dependent parser (see Parser), which is resolved again at every path
+    def __init__(self, parsers: Iterable[Parser] | None = None):
+        # De-duplicate by identity, since parsers aren't required to be hashable
+        unique = {id(parser): parser for parser in (parsers or DEFAULT_PARSERS)}
+        self.parsers: tuple[Parser, ...] = tuple(unique.values())
+        self._stages = tuple(_StageTable.build(stage, self.parsers) for stage in STAGES)
+        self._plan: dict[Any, Parser] = {}
+        self._root = JqPath.parse('.')
+
+    def parse(self, cls: Type[T], data: Any) -> T:
+        return self.subparse(path=self._root, field_type=cls, data=data)
+
+    def iter_parse(self, cls: Type[T], items: Iterable[Any], *, start: int = 0) -> Iterator[T]:
+        # Each item is parsed as cls, at the path .[index]. The parser for cls is only resolved once for all of them
+        root = self._root
+        parser = self.resolve(path=root, field_type=cls)
+        for index, data in enumerate(items, start):
+            yield parser.parse(path=root.child(index=index), field_type=cls, data=data, subparse=self)
+
+    def parse_many(self, cls: Type[T], items: Iterable[Any], *, start: int = 0) -> list[T]:
+        return list(self.iter_parse(cls, items, start=start))
+
+    def subparse(self, *, path: JqPath, field_type: type, data: Any) -> Any:
+        return self.resolve(path=path, field_type=field_type).parse(
+            path=path, field_type=field_type, data=data, subparse=self
+        )
+
+    __call__ = subparse
 
-def parse(cls: Type[T], data: Any, parsers: Sequence[Parser] | None = None) -> T:
-    parsers = [x for x in (parsers or DEFAULT_PARSERS)]
-    shuffle(parsers)  # The ordering of the parsers should never matter, enforce that by randomizing the order 😈
+    def resolve(self, *, path: JqPath, field_type: type) -> Parser:
+        try:
+            return self._plan[field_type]
+        except KeyError:
+            parser, path_dependent = self._find_parser(path=path, field_type=field_type)
+            if not path_dependent:
+                self._plan[field_type] = parser
+            return parser
+        except TypeError:  # Unhashable field_type, e.g. Annotated with unhashable metadata
+            return self._find_parser(path=path, field_type=field_type)[0]
 
-    def subparse(path: JqPath, field_type: type, data: Any) -> Any:
-        for stage in (Stage.Override, Stage.Exact, Stage.Fallback, Stage.LastChance):
-            for parser in parsers:
-                if parser.can_parse(stage=stage, path=path, field_type=field_type):
-                    return parser.parse(path=path, field_type=field_type, data=data, subparse=subparse)
+    def is_planned(self, field_type: Any) -> bool:
+        # Whether the parser for field_type has been resolved and stored in the plan. It isn't when the type is
+        # unhashable, or when the choice depends on the path
+        try:
+            return field_type in self._plan
+        except TypeError:
+            return False
+
+    def _find_parser(self, *, path: JqPath, field_type: type) -> tuple[Parser, bool]:
+        # Returns the parser, and whether the choice depends on the path
+        path_dependent = False
+        for table in self._stages:
+            stage = table.stage
+            path_dependent = path_dependent or table.path_dependent
+            # The parsers which claimed the type are still checked against the others, but only once per type
+            dispatched = table.lookup(field_type)
+            matches = [] if dispatched is None else [dispatched]
+            matches += [
+                parser for parser in table.parsers if parser.can_parse(stage=stage, path=path, field_type=field_type)
+            ]
+            if len(matches) == 1:
+                return matches[0], path_dependent
+            if len(matches) > 1:
+                # The ordering of the parsers should never matter, so more than one match in a stage is an error
+                raise ValueError(f'Ambiguous parsers {matches} for {field_type} at {path} in stage {stage}')
         raise ValueError(f'No parser found for {field_type} at {path}')
 
-    return subparse(path=JqPath.parse('.'), field_type=cls, data=data)
+
+DEFAULT_DECODER = Decoder(DEFAULT_PARSERS)
+
+
+def parse(cls: Type[T], data: Any, parsers: Iterable[Parser] | None = None) -> T:
+    return _get_decoder(parsers).parse(cls, data)
+
+
+def parse_many(cls: Type[T], items: Iterable[Any], parsers: Iterable[Parser] | None = None) -> list[T]:
+    return _get_decoder(parsers).parse_many(cls, items)
+
+
+def iter_parse(cls: Type[T], items: Iterable[Any], parsers: Iterable[Parser] | None = None) -> Iterator[T]:
+    return _get_decoder(parsers).iter_parse(cls, items)
+
+
+def _get_decoder(parsers: Iterable[Parser] | None) -> Decoder:
+    if not parsers:
+        return DEFAULT_DECODER
+    try:
+        return _cached_decoder(frozenset(parsers))
+    except TypeError:
+        # Parsers which aren't hashable can't be used as a cache key, so build a one-off decoder for them
+        return Decoder(parsers)
+
+
+@lru_cache(maxsize=64)
+def _cached_decoder(parsers: frozenset[Parser]) -> Decoder:
+    return Decoder(parsers)
@@ -2,8 +2,10 @@ from dict2any.parsers.parser import (  # isort:skip
     Parser,
     Stage,
     Subparse,
+    parses_unchanged,
 )
 from dict2any.parsers.any import AnyParser
+from dict2any.parsers.array import ArrayParser, NumpyArrayParser, Typecode
 from dict2any.parsers.base_types import (
     BoolParser,
     FloatParser,
@@ -15,6 +17,7 @@ from dict2any.parsers.class_parser import ClassParser
 from dict2any.parsers.dataclass import DataclassParser
 from dict2any.parsers.dict import DictParser, TypedDictParser
 from dict2any.parsers.list import ListParser
+from dict2any.parsers.literal import LiteralParser
 from dict2any.parsers.path import PathParser
 from dict2any.parsers.tuple import NamedTupleParser, TupleParser
-from dict2any.parsers.union import UnionParser
+from dict2any.parsers.union import Discriminator, UnionParser
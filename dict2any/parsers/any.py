@@ -1,10 +1,14 @@
 from typing import Any, get_origin
 
 from dict2any.jq_path import JqPath
-from dict2any.parsers.parser import Parser, Stage, Subparse
+from dict2any.parsers.parser import Parser, Stage, Subparse, parses_unchanged
 
 
 class AnyParser(Parser):
+    stages = (Stage.Exact,)
+    dispatch_types = {Stage.Exact: (Any,)}
+    dispatch_origins = {Stage.Exact: (Any,)}
+
     def can_parse(self, stage: Stage, path: JqPath, field_type: type):
         match stage:
             case Stage.Exact:
@@ -12,5 +16,6 @@ class AnyParser(Parser):
             case _:
                 return False
 
+    @parses_unchanged
     def parse(self, *, path: JqPath, field_type: type, data: Any, subparse: Subparse) -> Any:
         return data
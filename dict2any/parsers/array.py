@@ -0,0 +1,92 @@
+import array
+import sys
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Annotated, Any, get_args, get_origin
+
+from dict2any.jq_path import JqPath
+from dict2any.parsers.parser import Parser, Stage, Subparse
+
+
+@dataclass(frozen=True)
+class Typecode:
+    # Annotated[array.array, Typecode('i')] picks the typecode of the array. A plain array.array holds doubles ('d')
+    code: str
+
+
+class ArrayParser(Parser):
+    # Fills an array.array from a sequence of numbers in one call, so the values are stored packed (e.g. 8 bytes per
+    # double), instead of as a list of python objects
+    stages = (Stage.Exact, Stage.Fallback)
+    dispatch_types = {Stage.Exact: (array.array,)}
+    input_types = (Sequence,)
+
+    def can_parse(self, *, stage: Stage, path: JqPath, field_type: type):
+        match stage:
+            case Stage.Exact:
+                return field_type is array.array
+            case Stage.Fallback:
+                return get_origin(field_type) is Annotated and _typecode(field_type) is not None
+            case _:
+                return False
+
+    def parse(self, *, path: JqPath, field_type: type, data: Any, subparse: Subparse) -> Any:
+        # bytes would be read as the raw machine values, rather than as numbers
+        if not isinstance(data, Sequence) or isinstance(data, (str, bytes, bytearray)):
+            raise ValueError(f"Invalid type: {type(data)}")
+        try:
+            return array.array(_typecode(field_type) or 'd', data)
+        except (TypeError, OverflowError) as e:
+            raise ValueError(f"Invalid array: {e}") from e
+
+
+def _typecode(field_type: Any) -> str | None:
+    if get_origin(field_type) is not Annotated or field_type.__origin__ is not array.array:
+        return None
+    return next((m.code for m in field_type.__metadata__ if isinstance(m, Typecode)), None)
+
+
+class NumpyArrayParser(Parser):
+    # Parses numpy.ndarray, and numpy.typing.NDArray[dtype], when numpy is installed.
+    # numpy is never imported here: a type which refers to numpy can only exist once it's been imported
+    stages = (Stage.Exact,)
+
+    def can_parse(self, *, stage: Stage, path: JqPath, field_type: type):
+        match stage:
+            case Stage.Exact:
+                numpy = sys.modules.get('numpy')
+                return numpy is not None and (field_type is numpy.ndarray or get_origin(field_type) is numpy.ndarray)
+            case _:
+                return False
+
+    def parse(self, *, path: JqPath, field_type: type, data: Any, subparse: Subparse) -> Any:
+        numpy = sys.modules['numpy']
+        if isinstance(data, (str, bytes, bytearray, dict)):
+            raise ValueError(f"Invalid type: {type(data)}")
+        try:
+            # The conversion (and the check of every value) happens in numpy, rather than one item at a time
+            result = numpy.asarray(data)
+        except ValueError as e:  # e.g. nested lists of different lengths
+            raise ValueError(f"Invalid array: {e}") from e
+        if result.dtype.kind not in 'biufc':
+            raise ValueError(f"Invalid array dtype: {result.dtype}")
+
+        dtype = _numpy_dtype(field_type)
+        if dtype is None:
+            return result
+        try:
+            # Allows e.g. int to float, but not float to int, or anything to bool
+            return result.astype(dtype, casting='same_kind', copy=False)
+        except TypeError as e:
+            raise ValueError(f"Invalid array: {e}") from e
+
+
+def _numpy_dtype(field_type: Any) -> Any:
+    # ndarray[shape, numpy.dtype[scalar]] -> scalar, or None when it isn't given
+    args = get_args(field_type)
+    if len(args) != 2:
+        return None
+    scalar_args = get_args(args[1])
+    if len(scalar_args) != 1 or scalar_args[0] is Any:
+        return None
+    return scalar_args[0]
@@ -2,14 +2,17 @@ from inspect import isclass
 from typing import Any
 
 from dict2any.jq_path import JqPath
-from dict2any.parsers.parser import Parser, Stage, Subparse
+from dict2any.parsers.parser import Parser, Stage, Subparse, parses_unchanged
 
 
 class BaseParser(Parser):
+    stages = (Stage.Exact, Stage.Fallback)
     field_type: type
 
     def __init__(self, field_type: type):
         self.field_type = field_type
+        self.dispatch_types = {Stage.Exact: (field_type,)}
+        self.input_types = (field_type,)
 
     def can_parse(self, *, stage: Stage, path: JqPath, field_type: type):
         match stage:
@@ -20,6 +23,7 @@ class BaseParser(Parser):
             case _:
                 return False
 
+    @parses_unchanged
     def parse(self, *, path: JqPath, field_type: type, data: Any, subparse: Subparse) -> Any:
         if not isinstance(data, self.field_type):
             raise ValueError(f"Invalid type: {type(data)}")
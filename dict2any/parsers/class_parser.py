@@ -1,25 +1,81 @@
 import inspect
 from collections.abc import Mapping
+from dataclasses import dataclass
 from types import FunctionType
-from typing import Any, Optional, Union, get_args, get_origin
+from typing import Any, get_type_hints
 
 from dict2any.jq_path import JqPath
 from dict2any.parsers.parser import Parser, Stage, Subparse
+from dict2any.parsers.type_cache import TypeCache
+
+
+@dataclass(frozen=True)
+class ClassParameter:
+    name: str
+    kind: inspect._ParameterKind
+    default: Any
+    annotation: Any
+
+    @property
+    def required(self) -> bool:
+        return self.default is inspect.Parameter.empty
+
+
+@dataclass(frozen=True)
+class ClassSignature:
+    # The keyword parameters of __init__, without self, *args or **kwargs
+    parameters: tuple[ClassParameter, ...]
+    accepts_kwargs: bool
+    has_positional_only: bool
+
+
+@TypeCache
+def get_signature(field_type: type) -> ClassSignature:
+    # inspect.signature is expensive, so it's computed once per class
+    init = field_type.__init__  # type: ignore[misc]
+    try:
+        type_hints = get_type_hints(init, include_extras=True)
+    except Exception:  # Not a python function (e.g. object.__init__), or annotations which can't be resolved
+        type_hints = {}
+
+    parameters: list[ClassParameter] = []
+    accepts_kwargs = False
+    has_positional_only = False
+    for i, (name, parameter) in enumerate(inspect.signature(init).parameters.items()):
+        if parameter.kind is inspect.Parameter.POSITIONAL_ONLY and i != 0:
+            has_positional_only = True
+        if parameter.kind is inspect.Parameter.VAR_KEYWORD:
+            accepts_kwargs = True
+        if (i == 0 and name == "self") or parameter.kind in (
+            inspect.Parameter.VAR_POSITIONAL,
+            inspect.Parameter.VAR_KEYWORD,
+        ):
+            continue
+        annotation = type_hints.get(name, parameter.annotation)
+        parameters.append(
+            ClassParameter(
+                name=name,
+                kind=parameter.kind,
+                default=parameter.default,
+                annotation=Any if annotation is inspect.Parameter.empty else annotation,
+            )
+        )
+    return ClassSignature(
+        parameters=tuple(parameters), accepts_kwargs=accepts_kwargs, has_positional_only=has_positional_only
+    )
 
 
 class ClassParser(Parser):
+    stages = (Stage.LastChance,)
+    input_types = (Mapping,)
+
     def can_parse(self, stage: Stage, path: JqPath, field_type: type):
         match stage:
             case Stage.LastChance:
                 return (
                     inspect.isclass(field_type)
                     and not issubclass(field_type, FunctionType)
-                    and not any(
-                        [
-                            param.kind is inspect.Parameter.POSITIONAL_ONLY and i != 0
-                            for i, param in enumerate(inspect.signature(field_type.__init__).parameters.values())
-                        ]
-                    )
+                    and not get_signature(field_type).has_positional_only
                 )
             case _:
                 return False
@@ -27,20 +83,12 @@ class ClassParser(Parser):
     def parse(self, *, path: JqPath, field_type: type, data: Any, subparse: Subparse) -> Any:
         if not isinstance(data, Mapping):
             raise ValueError(f"Invalid type: {type(data)}")
-        parameters = inspect.signature(field_type.__init__).parameters.items()  # type: ignore[misc]
-        kwargs = (
-            {k: v for k, v in data.items()}
-            if any(p.kind is inspect.Parameter.VAR_KEYWORD for _, p in parameters)
-            else dict()
-        )
-        for i, (name, parameter) in enumerate(parameters):
-            if (i == 0 and name == "self") or parameter.kind in (
-                inspect.Parameter.VAR_POSITIONAL,
-                inspect.Parameter.VAR_KEYWORD,
-            ):
-                continue
+        signature = get_signature(field_type)
+        kwargs = {k: v for k, v in data.items()} if signature.accepts_kwargs else dict()
+        for parameter in signature.parameters:
+            name = parameter.name
             if name in data:
                 kwargs[name] = subparse(path=path.child(name=name), field_type=parameter.annotation, data=data[name])
-            elif parameter.default is inspect.Parameter.empty:
+            elif parameter.required:
                 raise ValueError(f"Missing required parameter: {name}")
         return field_type(**kwargs)
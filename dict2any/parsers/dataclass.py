@@ -1,13 +1,86 @@
 import dataclasses
+import weakref
 from collections.abc import Mapping
-from typing import Any, Mapping
+from dataclasses import dataclass
+from typing import Any, get_type_hints
 
 from dict2any.jq_path import JqPath
-from dict2any.parsers import Parser, Stage, Subparse
-from dict2any.parsers.parser import Stage
+from dict2any.parsers.parser import (
+    Parser,
+    Resolver,
+    Stage,
+    Subparse,
+    get_resolver,
+    returns_unchanged,
+)
+from dict2any.parsers.type_cache import TypeCache
+
+
+@dataclass(frozen=True)
+class DataclassField:
+    name: str
+    type: Any
+    has_default: bool
+    # dataclasses.MISSING when the field doesn't have one
+    default: Any = dataclasses.MISSING
+    default_factory: Any = dataclasses.MISSING
+
+    def get_default(self) -> Any:
+        return self.default if self.default is not dataclasses.MISSING else self.default_factory()
+
+
+@dataclass(frozen=True)
+class DataclassSchema:
+    # Only the fields which are passed to __init__
+    fields: tuple[DataclassField, ...]
+    field_names: frozenset[str]
+    required: frozenset[str]
+    # For trusted construction, which bypasses __init__: the fields which aren't passed to __init__ but have a default,
+    # and whether every field is stored in the instance __dict__ (rather than some in __slots__)
+    other_defaults: tuple[DataclassField, ...] = ()
+    uses_dict: bool = True
+
+
+@TypeCache
+def get_schema(field_type: type) -> DataclassSchema:
+    try:
+        # Resolves string annotations, e.g. from `from __future__ import annotations`
+        type_hints = get_type_hints(field_type, include_extras=True)
+    except Exception:
+        type_hints = {}
+
+    fields = tuple(
+        DataclassField(
+            name=field.name,
+            type=type_hints.get(field.name, field.type),
+            has_default=field.default is not dataclasses.MISSING or field.default_factory is not dataclasses.MISSING,
+            default=field.default,
+            default_factory=field.default_factory,
+        )
+        for field in dataclasses.fields(field_type)
+    )
+    init = [field.init for field in dataclasses.fields(field_type)]
+    init_fields = tuple(field for field, is_init in zip(fields, init) if is_init)
+    return DataclassSchema(
+        fields=init_fields,
+        field_names=frozenset(field.name for field in init_fields),
+        required=frozenset(field.name for field in init_fields if not field.has_default),
+        other_defaults=tuple(field for field, is_init in zip(fields, init) if not is_init and field.has_default),
+        uses_dict=not any('__slots__' in vars(klass) for klass in field_type.__mro__[:-1]),
+    )
 
 
 class DataclassParser(Parser):
+    stages = (Stage.Exact,)
+    input_types = (Mapping,)
+
+    def __init__(self, trusted: bool = False):
+        # In trusted mode, instances are built with object.__new__ and their fields are assigned directly, so neither
+        # __init__ nor __post_init__ is called (and frozen dataclasses don't pay for object.__setattr__ in __init__).
+        # Fields which would be returned unchanged (e.g. an int) aren't type checked. Nested fields are still parsed,
+        # and defaults are still filled in. Only use it for input which is known to be valid
+        self.trusted = trusted
+
     def can_parse(self, *, stage: Stage, path: JqPath, field_type: type):
         match stage:
             case Stage.Exact:
@@ -15,21 +88,86 @@ class DataclassParser(Parser):
             case _:
                 return False
 
+    def accepts(self, *, field_type: type, data: Any) -> bool:
+        if not isinstance(data, Mapping):
+            return False
+        schema = get_schema(field_type)
+        return schema.field_names.issuperset(data.keys()) and all(name in data for name in schema.required)
+
     def parse(self, *, path: JqPath, field_type: type, data: Any, subparse: Subparse) -> Any:
         if not isinstance(data, Mapping):
             raise ValueError(f"Invalid type: {type(data)}")
 
-        fields = [field for field in dataclasses.fields(field_type) if field.init]
-        field_names = frozenset(field.name for field in fields)
-        if any(key not in field_names for key in data.keys()):
-            raise ValueError(f"Unknown keys: {frozenset(data.keys()) - field_names}")
+        schema = get_schema(field_type)
+        if not schema.field_names.issuperset(data.keys()):
+            raise ValueError(f"Unknown keys: {frozenset(data.keys()) - schema.field_names}")
+
+        if self.trusted:
+            return self._parse_trusted(path=path, field_type=field_type, data=data, subparse=subparse, schema=schema)
 
         kwargs = {}
-        for field in fields:
+        for field in schema.fields:
             if field.name in data:
                 kwargs[field.name] = subparse(
                     path=path.child(name=field.name), field_type=field.type, data=data[field.name]
                 )
-            elif field.default is dataclasses.MISSING and field.default_factory is dataclasses.MISSING:
+            elif not field.has_default:
                 raise ValueError(f"Missing required field: {field.name}")
         return field_type(**kwargs)
+
+    def _parse_trusted(
+        self, *, path: JqPath, field_type: type, data: Mapping, subparse: Subparse, schema: DataclassSchema
+    ) -> Any:
+        unchanged = _unchanged_fields(subparse, path, field_type, schema)
+        values = {}
+        for field in schema.fields:
+            if field.name in data:
+                item = data[field.name]
+                if field.name in unchanged:
+                    values[field.name] = item
+                else:
+                    values[field.name] = subparse(path=path.child(name=field.name), field_type=field.type, data=item)
+            elif field.has_default:
+                values[field.name] = field.get_default()
+            else:
+                raise ValueError(f"Missing required field: {field.name}")
+        for field in schema.other_defaults:
+            values[field.name] = field.get_default()
+
+        instance: Any = object.__new__(field_type)
+        if schema.uses_dict:
+            instance.__dict__.update(values)
+        else:
+            for name, value in values.items():
+                object.__setattr__(instance, name, value)
+        return instance
+
+
+# The fields of each dataclass which the decoder would return unchanged, e.g. an int. Keyed by the decoder, since
+# that's what picks the parsers
+_unchanged: weakref.WeakKeyDictionary[Any, dict[Any, frozenset[str]]] = weakref.WeakKeyDictionary()
+
+
+def _unchanged_fields(subparse: Subparse, path: JqPath, field_type: type, schema: DataclassSchema) -> frozenset[str]:
+    resolver = get_resolver(subparse)
+    if resolver is None:
+        return frozenset()
+    cache = None
+    try:
+        return _unchanged[subparse][field_type]
+    except KeyError:
+        cache = _unchanged.setdefault(subparse, {})
+    except TypeError:  # A subparse which can't be weakly referenced, so it isn't cached
+        pass
+    unchanged = frozenset(field.name for field in schema.fields if _returns_unchanged(resolver, path, field.type))
+    if cache is not None:
+        cache[field_type] = unchanged
+    return unchanged
+
+
+def _returns_unchanged(resolver: Resolver, path: JqPath, field_type: Any) -> bool:
+    try:
+        parser = resolver.resolve(path=path, field_type=field_type)
+    except ValueError:  # No parser. Let subparse raise the error, with the path of the field
+        return False
+    return returns_unchanged(parser)
@@ -1,14 +1,34 @@
 from collections import OrderedDict
 from collections.abc import Mapping
+from dataclasses import dataclass
 from inspect import isclass
-from typing import Any, TypedDict, get_args, get_origin, get_type_hints
+from itertools import islice
+from typing import (
+    Any,
+    NotRequired,
+    Required,
+    TypedDict,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 from dict2any.jq_path import JqPath
-from dict2any.parsers import Parser, Stage, Subparse
-from dict2any.parsers.parser import Stage
+from dict2any.parsers.parser import Parser, Stage, Subparse
+from dict2any.parsers.type_cache import TypeCache
 
 
 class DictParser(Parser):
+    stages = (Stage.Exact, Stage.Fallback)
+    dispatch_types = {Stage.Exact: (dict, OrderedDict)}
+    dispatch_origins = {Stage.Exact: (dict, OrderedDict)}
+    input_types = (Mapping,)
+
+    def __init__(self, borrow: bool = False):
+        # In borrow mode, a dict whose keys and values all parse to themselves is returned as is, instead of being
+        # copied. Only use it when nothing else holds on to the input (e.g. it came straight from json.loads)
+        self.borrow = borrow
+
     def can_parse(self, *, stage: Stage, path: JqPath, field_type: type):
         match stage:
             case Stage.Exact:
@@ -31,17 +51,64 @@ class DictParser(Parser):
 
         key_type, val_type = args
 
-        return field_type(
-            {
-                subparse(path=path.child(name=str(key)), field_type=key_type, data=key): subparse(
-                    path=path.child(name=str(key)), field_type=val_type, data=val
-                )
-                for key, val in data.items()
-            }
-        )
+        if self.borrow and (field_type is dict or get_origin(field_type) is dict):
+            # The copy is only started at the first entry which parses to different objects
+            borrowed: dict | None = None
+            for index, (key, val) in enumerate(data.items()):
+                child_path = path.child(name=str(key))
+                parsed_key = subparse(path=child_path, field_type=key_type, data=key)
+                parsed_val = subparse(path=child_path, field_type=val_type, data=val)
+                if borrowed is None:
+                    if parsed_key is key and parsed_val is val:
+                        continue
+                    borrowed = dict(islice(data.items(), index))
+                borrowed[parsed_key] = parsed_val
+            if borrowed is not None:
+                return borrowed
+            return data if type(data) is dict else dict(data)
+
+        items = {}
+        for key, val in data.items():
+            child_path = path.child(name=str(key))
+            items[subparse(path=child_path, field_type=key_type, data=key)] = subparse(
+                path=child_path, field_type=val_type, data=val
+            )
+        return field_type(items)
+
+
+@dataclass(frozen=True)
+class TypedDictSchema:
+    type_hints: dict[str, Any]
+    required_keys: frozenset[str]
+    optional_keys: frozenset[str]
+    allow_unknown_keys: bool
+
+
+@TypeCache
+def get_typed_dict_schema(field_type: type) -> TypedDictSchema:
+    # get_type_hints re-evaluates the annotations of the whole MRO, so it's computed once per TypedDict
+    return TypedDictSchema(
+        type_hints={
+            key: _strip_required(hint) for key, hint in get_type_hints(field_type, include_extras=True).items()
+        },
+        required_keys=getattr(field_type, '__required_keys__', frozenset()),
+        optional_keys=getattr(field_type, '__optional_keys__', frozenset()),
+        allow_unknown_keys=not getattr(field_type, '__total__', True),
+    )
+
+
+def _strip_required(hint: Any) -> Any:
+    # include_extras keeps Annotated (e.g. a Typecode), but also Required and NotRequired, which are already in the
+    # required and optional keys
+    while get_origin(hint) in (Required, NotRequired):
+        hint = get_args(hint)[0]
+    return hint
 
 
 class TypedDictParser(Parser):
+    stages = (Stage.Exact,)
+    input_types = (Mapping,)
+
     def can_parse(self, *, stage: Stage, path: JqPath, field_type: type):
         match stage:
             case Stage.Exact:
@@ -49,19 +116,28 @@ class TypedDictParser(Parser):
             case _:
                 return False
 
+    def accepts(self, *, field_type: type, data: Any) -> bool:
+        if not isinstance(data, Mapping):
+            return False
+        schema = get_typed_dict_schema(field_type)
+        if not all(key in data for key in schema.required_keys):
+            return False
+        return schema.allow_unknown_keys or all(
+            key in schema.required_keys or key in schema.optional_keys for key in data.keys()
+        )
+
     def parse(self, *, path: JqPath, field_type: type, data: Any, subparse: Subparse) -> Any:
         if not isinstance(data, Mapping):
             raise ValueError(f"Invalid type: {type(data)}")
-        required_keys: frozenset = getattr(field_type, '__required_keys__', frozenset())
+        schema = get_typed_dict_schema(field_type)
+        required_keys = schema.required_keys
         if any(key not in data for key in required_keys):
             raise ValueError(f"Missing required keys: {required_keys - frozenset(data.keys())}")
 
         kwargs = {}
-        allow_unknown_keys: bool = not getattr(field_type, '__total__', True)
-        optional_keys: frozenset = getattr(field_type, '__optional_keys__', frozenset())
-        type_hints = get_type_hints(field_type)
+        type_hints = schema.type_hints
         for key, value in data.items():
-            if not allow_unknown_keys and (key not in required_keys) and (key not in optional_keys):
+            if not schema.allow_unknown_keys and (key not in required_keys) and (key not in schema.optional_keys):
                 raise ValueError(f"Unknown key: {key}")
             parsed_value = subparse(path=path.child(name=str(key)), field_type=type_hints.get(key, Any), data=value)
             kwargs[key] = parsed_value
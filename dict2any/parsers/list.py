@@ -1,12 +1,29 @@
 from collections.abc import MutableSequence, Sequence
 from inspect import isclass
+from itertools import islice, repeat
 from typing import Any, get_args, get_origin
 
 from dict2any.jq_path import JqPath
-from dict2any.parsers.parser import Parser, Stage, Subparse
+from dict2any.parsers.parser import (
+    Parser,
+    Stage,
+    Subparse,
+    get_resolver,
+    returns_unchanged,
+)
 
 
 class ListParser(Parser):
+    stages = (Stage.Exact, Stage.Fallback)
+    dispatch_types = {Stage.Exact: (list,)}
+    dispatch_origins = {Stage.Exact: (list,)}
+    input_types = (Sequence,)
+
+    def __init__(self, borrow: bool = False):
+        # In borrow mode, a list whose items all parse to themselves is returned as is, instead of being copied.
+        # Only use it when nothing else holds on to the input (e.g. it came straight from json.loads)
+        self.borrow = borrow
+
     def can_parse(self, *, stage: Stage, path: JqPath, field_type: type):
         match stage:
             case Stage.Exact:
@@ -26,7 +43,39 @@ class ListParser(Parser):
 
         args = get_args(field_type)
         sub_type = Any if len(args) == 0 else args[0]
+        resolver = get_resolver(subparse)
+        if resolver is not None:
+            try:
+                parser = resolver.resolve(path=path, field_type=sub_type)
+            except ValueError:  # Raised again below, with the path of the first item
+                parser = None
+            # Items which are returned unchanged are checked in one pass, without a path or a subparse call for each.
+            # If any of them is invalid, the loop below raises the error for the first one
+            if returns_unchanged(parser):
+                input_types = getattr(parser, 'input_types', None)
+                if input_types is None or all(map(isinstance, data, repeat(input_types))):
+                    return self._unchanged(field_type, data)
+
+        if self.borrow and (field_type is list or get_origin(field_type) is list):
+            # The copy is only started at the first item which parses to a different object
+            items: list[Any] | None = None
+            for index, item in enumerate(data):
+                value = subparse(path=path.child(index=index), field_type=sub_type, data=item)
+                if items is None:
+                    if value is item:
+                        continue
+                    items = list(islice(data, index))
+                items.append(value)
+            return self._unchanged(field_type, data) if items is None else items
+
         sub_items = [
             subparse(path=path.child(index=index), field_type=sub_type, data=item) for index, item in enumerate(data)
         ]
         return field_type(sub_items)
+
+    def _unchanged(self, field_type: Any, data: Sequence) -> Any:
+        # The result when every item parsed to itself. Only a borrowed list is returned as is, any other target gets
+        # a new list, since e.g. a custom MutableSequence may keep the object it's given
+        if field_type is list or get_origin(field_type) is list:
+            return data if self.borrow and type(data) is list else list(data)
+        return field_type(list(data))
@@ -0,0 +1,25 @@
+from typing import Any, Literal, get_args, get_origin
+
+from dict2any.jq_path import JqPath
+from dict2any.parsers.parser import Parser, Stage, Subparse
+
+
+class LiteralParser(Parser):
+    stages = (Stage.Exact,)
+    dispatch_origins = {Stage.Exact: (Literal,)}
+
+    def can_parse(self, *, stage: Stage, path: JqPath, field_type: type):
+        match stage:
+            case Stage.Exact:
+                return get_origin(field_type) is Literal
+            case _:
+                return False
+
+    def accepts(self, *, field_type: type, data: Any) -> bool:
+        # The type is compared too, so that True doesn't match Literal[1]
+        return any(type(data) is type(value) and data == value for value in get_args(field_type))
+
+    def parse(self, *, path: JqPath, field_type: type, data: Any, subparse: Subparse) -> Any:
+        if not self.accepts(field_type=field_type, data=data):
+            raise ValueError(f"Invalid value: {data!r}")
+        return data
@@ -1,5 +1,5 @@
 from enum import StrEnum, auto
-from typing import Any, Protocol
+from typing import Any, Callable, Protocol, TypeVar, cast
 
 from dict2any.jq_path import JqPath
 
@@ -17,8 +17,55 @@ class Subparse(Protocol):
 
 
 class Parser(Protocol):
+    # Parsers may optionally set a `stages` attribute, listing the stages they can_parse in.
+    # The Decoder only calls can_parse for those stages. Parsers without it are asked in every stage.
+    #
+    # Parsers whose decision only depends on the identity of the field_type (or of get_origin(field_type)) may also
+    # set `dispatch_types` and/or `dispatch_origins`, e.g. {Stage.Exact: (list,)}. For those stages, the Decoder finds
+    # the parser with a dict lookup instead of calling can_parse, and rejects two parsers which claim the same type.
+    #
+    # The chosen parser is stored per field_type, so can_parse is only called for the first path a type appears at.
+    # Parsers whose can_parse depends on the path must set `path_dependent = True`. Types which are offered to them are
+    # then resolved again at every path (which is slower, and those types aren't compiled by dict2any.codegen).
+    #
+    # Parsers which only accept data of some runtime types may set `input_types`, e.g. (Mapping,). Parsers such as
+    # UnionParser use it to skip the parsers which would raise for the data, without calling them.
+    #
+    # Parsers may also define `accepts(*, field_type, data) -> bool`, a cheap check of the shape of data (e.g. that a
+    # mapping has the required keys, without parsing the values). It returns False, instead of raising, for data
+    # which parse would reject straight away. parse may still raise for data which it accepts.
+    #
+    # A parse method which returns the data as is (after checking it's one of the input_types, if those are set) may be
+    # marked with @parses_unchanged. Callers such as ListParser then check every item in one pass, without calling it
     def can_parse(self, *, stage: Stage, path: JqPath, field_type: type):
         ...
 
     def parse(self, *, path: JqPath, field_type: type, data: Any, subparse: Subparse) -> Any:
         ...
+
+
+class Resolver(Subparse, Protocol):
+    # A Subparse which can also return the parser it uses for a type, e.g. a Decoder
+    def resolve(self, *, path: JqPath, field_type: type) -> Parser:
+        ...
+
+
+def get_resolver(subparse: Subparse) -> Resolver | None:
+    # subparse, if it can resolve parsers. Looked up on the class, since a plain Subparse function (or a Mock) can't
+    if getattr(type(subparse), 'resolve', None) is None:
+        return None
+    return cast(Resolver, subparse)
+
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+def parses_unchanged(parse: F) -> F:
+    # The mark is on the function, so a subclass which overrides parse doesn't inherit it
+    setattr(parse, '_returns_unchanged', True)
+    return parse
+
+
+def returns_unchanged(parser: Any) -> bool:
+    # Whether parser (which may be None) returns the data as is, see parses_unchanged
+    return getattr(getattr(type(parser), 'parse', None), '_returns_unchanged', False)
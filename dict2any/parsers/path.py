@@ -6,6 +6,10 @@ from dict2any.parsers.parser import Parser, Stage, Subparse
 
 
 class PathParser(Parser):
+    stages = (Stage.Exact,)
+    dispatch_types = {Stage.Exact: (Path,)}
+    input_types = (str, Path)
+
     def can_parse(self, stage: Stage, path: JqPath, field_type: type):
         match stage:
             case Stage.Exact:
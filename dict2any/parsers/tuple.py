@@ -4,9 +4,15 @@ from typing import Any, NamedTuple, get_args, get_origin, get_type_hints
 
 from dict2any.jq_path import JqPath
 from dict2any.parsers.parser import Parser, Stage, Subparse
+from dict2any.parsers.type_cache import TypeCache
 
 
 class TupleParser(Parser):
+    stages = (Stage.Exact,)
+    dispatch_types = {Stage.Exact: (tuple,)}
+    dispatch_origins = {Stage.Exact: (tuple,)}
+    input_types = (Sequence,)
+
     def can_parse(self, stage: Stage, path: JqPath, field_type: type):
         match stage:
             case Stage.Exact:
@@ -14,6 +20,13 @@ class TupleParser(Parser):
             case _:
                 return False
 
+    def accepts(self, *, field_type: type, data: Any) -> bool:
+        if not isinstance(data, Sequence):
+            return False
+        args = get_args(field_type)
+        # Only fixed length tuples have a length to check
+        return len(args) == 0 or (len(args) == 2 and args[1] is Ellipsis) or len(args) == len(data)
+
     def parse(self, *, path: JqPath, field_type: type, data: Any, subparse: Subparse) -> Any:
         if not isinstance(data, Sequence):
             raise ValueError(f"Invalid type: {type(data)}")
@@ -32,6 +45,9 @@ class TupleParser(Parser):
 
 
 class NamedTupleParser(Parser):
+    stages = (Stage.Exact,)
+    input_types = (Sequence, Mapping)
+
     def can_parse(self, *, stage: Stage, path: JqPath, field_type: type):
         match stage:
             case stage.Exact:
@@ -39,29 +55,28 @@ class NamedTupleParser(Parser):
             case _:
                 return False
 
+    def accepts(self, *, field_type: type, data: Any) -> bool:
+        if not isinstance(data, (Sequence, Mapping)):
+            return False
+        sub_types = get_named_tuple_fields(field_type)
+        if len(sub_types) != len(data):
+            return False
+        return isinstance(data, Sequence) or all(field_name in data for field_name, _ in sub_types)
+
     def parse(self, *, path: JqPath, field_type: type, data: Any, subparse: Subparse) -> Any:
         kwargs = {}
         if not isinstance(data, Sequence) and not isinstance(data, Mapping):
             raise ValueError(f"Invalid type: {type(data)}")
 
-        sub_types: dict[str, Any] = {}
-        field_names: tuple = getattr(field_type, '_fields', tuple())
-        if NamedTuple in getattr(field_type, '__orig_bases__', tuple()):
-            type_hints = get_type_hints(field_type)
-            sub_types = {}
-            for field_name in field_names:
-                sub_types[field_name] = type_hints.get(field_name, Any)
-        else:
-            sub_types = {field_name: Any for field_name in field_names}
-
+        sub_types = get_named_tuple_fields(field_type)
         if len(sub_types) != len(data):
             raise ValueError(f"Invalid tuple length")
         if isinstance(data, Sequence):
-            for i, (field_name, sub_type) in enumerate(sub_types.items()):
+            for i, (field_name, sub_type) in enumerate(sub_types):
                 kwargs[field_name] = subparse(path=path.child(index=i), field_type=sub_type, data=data[i])
             return field_type(**kwargs)
         else:
-            for i, (field_name, sub_type) in enumerate(sub_types.items()):
+            for i, (field_name, sub_type) in enumerate(sub_types):
                 if field_name not in data:
                     raise ValueError(f"Missing field {field_name}")
 
@@ -69,3 +84,13 @@ class NamedTupleParser(Parser):
                     path=path.child(name=field_name), field_type=sub_type, data=data[field_name]
                 )
             return field_type(**kwargs)
+
+
+@TypeCache
+def get_named_tuple_fields(field_type: type) -> tuple[tuple[str, Any], ...]:
+    # The (name, type) of each field, in order. get_type_hints is expensive, so it's computed once per NamedTuple
+    field_names: tuple = getattr(field_type, '_fields', tuple())
+    if NamedTuple in getattr(field_type, '__orig_bases__', tuple()):
+        type_hints = get_type_hints(field_type, include_extras=True)
+        return tuple((field_name, type_hints.get(field_name, Any)) for field_name in field_names)
+    return tuple((field_name, Any) for field_name in field_names)
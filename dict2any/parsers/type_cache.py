@@ -0,0 +1,32 @@
+import functools
+from typing import Any, Callable, Generic, TypeVar, get_args
+
+V = TypeVar('V')
+
+
+class TypeCache(Generic[V]):
+    # Like functools.cache, for functions which introspect a single type.
+    # The entries are exposed, so they can be saved and restored by dict2any.plan_cache
+    def __init__(self, build: Callable[[Any], V]):
+        self.build = build
+        self.entries: dict[Any, V] = {}
+        functools.update_wrapper(self, build)
+
+    def __call__(self, field_type: Any) -> V:
+        try:
+            return self.entries[field_type]
+        except KeyError:
+            value = self.entries[field_type] = self.build(field_type)
+            return value
+        except TypeError:  # Unhashable, e.g. Annotated with unhashable metadata
+            return self.build(field_type)
+
+    def cache_clear(self) -> None:
+        self.entries.clear()
+
+
+def type_key(field_type: Any) -> Any:
+    # A cache key which tells apart types that compare equal, but have their arguments in a different order. A | B and
+    # B | A are equal (and hash the same), but don't try their arms in the same order, and neither do list[A | B] and
+    # list[B | A]. Like the types themselves, the key is unhashable if the type is
+    return (field_type, tuple(map(type_key, get_args(field_type))))
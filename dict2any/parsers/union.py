@@ -1,21 +1,191 @@
-from typing import Any, Optional, Union, get_args, get_origin
+import dataclasses
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass
+from inspect import isclass
+from types import UnionType
+from typing import (
+    Annotated,
+    Any,
+    Literal,
+    Optional,
+    TypedDict,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from dict2any.jq_path import JqPath
-from dict2any.parsers.parser import Parser, Stage, Subparse
+from dict2any.parsers.dataclass import get_schema
+from dict2any.parsers.dict import get_typed_dict_schema
+from dict2any.parsers.parser import Parser, Stage, Subparse, get_resolver
+from dict2any.parsers.type_cache import TypeCache, type_key
+
+
+@dataclass(frozen=True)
+class Discriminator:
+    # Annotated[A | B, Discriminator('kind')] picks the member of the union from the Literal value of data['kind']
+    key: str
+
+
+@dataclass(frozen=True)
+class UnionSchema:
+    arms: tuple[Any, ...]
+    # The key of the data which tells the arms apart, if there is one. tags maps (type(tag), tag) to the arm
+    discriminator: str | None
+    tags: dict[tuple[type, Any], Any]
+    # Set by an explicit Discriminator, in which case a mapping without the key is an error
+    requires_discriminator: bool
+
+
+def get_union_schema(field_type: Any) -> UnionSchema:
+    return _get_union_schema(type_key(field_type))
+
+
+@TypeCache
+def _get_union_schema(key: Any) -> UnionSchema:
+    field_type, _ = key
+    discriminators: list[Discriminator] = []
+    if get_origin(field_type) is Annotated:
+        discriminators = [m for m in field_type.__metadata__ if isinstance(m, Discriminator)]
+        field_type = field_type.__origin__
+    arms = get_args(field_type)
+    if discriminators:
+        key = discriminators[0].key
+        tags = _tags(arms, key)
+        if tags is None:
+            raise ValueError(f"{field_type} can't be discriminated by {key}")
+        return UnionSchema(arms=arms, discriminator=key, tags=tags, requires_discriminator=True)
+
+    # Otherwise, look for a Literal field which every member has, with different values
+    literal_fields = [_literal_fields(arm) for arm in arms if arm is not type(None)]
+    if len(literal_fields) >= 2 and all(fields is not None for fields in literal_fields):
+        for key in literal_fields[0]:  # type: ignore[union-attr]
+            tags = _tags(arms, key)
+            if tags is not None:
+                return UnionSchema(arms=arms, discriminator=key, tags=tags, requires_discriminator=False)
+    return UnionSchema(arms=arms, discriminator=None, tags={}, requires_discriminator=False)
+
+
+def _literal_fields(arm: Any) -> dict[str, Any] | None:
+    # The Literal fields of a dataclass or TypedDict, or None for any other type
+    if dataclasses.is_dataclass(arm) and isclass(arm):
+        fields = {field.name: field.type for field in get_schema(arm).fields}
+    elif isclass(arm) and TypedDict in getattr(arm, '__orig_bases__', tuple()):
+        fields = get_typed_dict_schema(arm).type_hints
+    else:
+        return None
+    return {name: field_type for name, field_type in fields.items() if get_origin(field_type) is Literal}
+
+
+def _tags(arms: tuple[Any, ...], key: str) -> dict[tuple[type, Any], Any] | None:
+    tags: dict[tuple[type, Any], Any] = {}
+    for arm in arms:
+        if arm is type(None):
+            continue
+        literal = (_literal_fields(arm) or {}).get(key)
+        if literal is None:
+            return None
+        for value in get_args(literal):
+            if (type(value), value) in tags:
+                return None
+            tags[(type(value), value)] = arm
+    return tags
 
 
 class UnionParser(Parser):
+    stages = (Stage.Exact, Stage.Fallback)
+    dispatch_types = {Stage.Exact: (Union, Optional)}
+    dispatch_origins = {Stage.Exact: (Union, UnionType)}
+
+    def __init__(self, adaptive: bool = False):
+        # In adaptive mode, the arms of a union (without a discriminator) are tried in order of how often they've
+        # succeeded, rather than in the order they're declared. Only use it for unions where at most one arm can
+        # accept any given data, otherwise the result can change over time.
+        # hits counts the successes of each arm, per union type. The counts don't depend on the order of the arms, so
+        # A | B and B | A share them
+        self.adaptive = adaptive
+        self.hits: dict[Any, Counter[Any]] = {}
+        # The order of each union, by type_key, since A | B and B | A each start in their own declared order.
+        # Each order is replaced rather than changed in place, so that a parse which is looping over it (e.g. an outer
+        # parse of the same recursive union, or another thread) still tries every arm
+        self._orders: dict[Any, tuple[Any, ...]] = {}
+
     def can_parse(self, stage: Stage, path: JqPath, field_type: type):
         match stage:
             case Stage.Exact:
-                return field_type in (Union, Optional) or get_origin(field_type) is Union
+                return field_type in (Union, Optional) or get_origin(field_type) in (Union, UnionType)
+            case Stage.Fallback:
+                # Annotated[A | B, Discriminator(...)]
+                if get_origin(field_type) is not Annotated:
+                    return False
+                inner, *metadata = get_args(field_type)
+                return get_origin(inner) in (Union, UnionType) and any(isinstance(m, Discriminator) for m in metadata)
             case _:
                 return False
 
     def parse(self, *, path: JqPath, field_type: type, data: Any, subparse: Subparse) -> Any:
-        for arg in get_args(field_type):
+        schema = get_union_schema(field_type)
+        key = schema.discriminator
+        if key is not None and isinstance(data, Mapping):
+            if key in data:
+                # Go straight to the arm with this tag, instead of trying each of them
+                tag = data[key]
+                try:
+                    arm = schema.tags[(type(tag), tag)]
+                except (KeyError, TypeError):
+                    raise ValueError(f"Invalid {key}: {tag!r}")
+                return subparse(path=path, field_type=arm, data=data)
+            if schema.requires_discriminator:
+                raise ValueError(f"Missing discriminator: {key}")
+
+        arms = self._ordered_arms(field_type, schema.arms) if self.adaptive else schema.arms
+        resolver = get_resolver(subparse)
+        for arg in arms:
             try:
-                return subparse(path=path, field_type=arg, data=data)
+                if resolver is not None:
+                    try:
+                        parser = resolver.resolve(path=path, field_type=arg)
+                    except ValueError:
+                        continue
+                    # Skip the arms which can't accept this data, rather than raising and catching their errors
+                    input_types = getattr(parser, 'input_types', None)
+                    if input_types is not None and not isinstance(data, input_types):
+                        continue
+                    accepts = getattr(parser, 'accepts', None)
+                    if accepts is not None and not accepts(field_type=arg, data=data):
+                        continue
+                    result = parser.parse(path=path, field_type=arg, data=data, subparse=subparse)
+                else:
+                    result = subparse(path=path, field_type=arg, data=data)
             except ValueError:
-                pass
+                continue
+            if self.adaptive:
+                self._hit(field_type, arg)
+            return result
         raise ValueError(f"Invalid type: {type(data)}")
+
+    def _ordered_arms(self, field_type: Any, arms: tuple[Any, ...]) -> tuple[Any, ...]:
+        key = type_key(field_type)
+        try:
+            return self._orders[key]
+        except KeyError:
+            self.hits.setdefault(field_type, Counter())
+            self._orders[key] = arms
+            return arms
+        except TypeError:  # Unhashable field_type, which can't be counted
+            return arms
+
+    def _hit(self, field_type: Any, arm: Any) -> None:
+        key = type_key(field_type)
+        try:
+            hits = self.hits[field_type]
+            order = self._orders[key]
+        except (KeyError, TypeError):
+            return
+        hits[arm] += 1
+        # Move the arm one place forward once it's been hit more often than the one before it.
+        # Over time, the arms end up ordered by how often they succeed
+        index = order.index(arm)
+        if index > 0 and hits[arm] > hits[order[index - 1]]:
+            self._orders[key] = (*order[: index - 1], arm, order[index - 1], *order[index + 1 :])
@@ -0,0 +1,183 @@
+import hashlib
+import importlib.util
+import os
+import pickle
+import re
+import sys
+from collections.abc import Iterable
+from inspect import isclass
+from pathlib import Path
+from typing import Any, get_args
+
+from dict2any.__about__ import __version__
+from dict2any.jq_path import JqPath
+from dict2any.parse import Decoder, _get_decoder
+from dict2any.parsers import (
+    ClassParser,
+    DataclassParser,
+    NamedTupleParser,
+    Parser,
+    TypedDictParser,
+)
+from dict2any.parsers.base_types import BaseParser
+from dict2any.parsers.class_parser import get_signature
+from dict2any.parsers.dataclass import get_schema
+from dict2any.parsers.dict import get_typed_dict_schema
+from dict2any.parsers.tuple import get_named_tuple_fields
+from dict2any.parsers.type_cache import TypeCache
+
+# The introspection done for each kind of parser, which is saved alongside the plan
+_SCHEMAS: dict[str, TypeCache] = {
+    'dataclass': get_schema,
+    'class': get_signature,
+    'typed_dict': get_typed_dict_schema,
+    'named_tuple': get_named_tuple_fields,
+}
+
+_ROOT = JqPath.parse('.')
+
+
+def warm_plan(cls: Any, directory: str | os.PathLike, parsers: Iterable[Parser] | None = None) -> bool:
+    # Loads the plan for cls from directory if it's up to date, otherwise resolves it and saves it for next time.
+    # Returns whether the plan was loaded
+    if load_plan(cls, directory, parsers):
+        return True
+    save_plan(cls, directory, parsers)
+    return False
+
+
+def load_plan(cls: Any, directory: str | os.PathLike, parsers: Iterable[Parser] | None = None) -> bool:
+    # Returns False, without changing anything, if there's no plan for cls or it's out of date
+    decoder = _get_decoder(parsers)
+    by_name = _parsers_by_name(decoder)
+    try:
+        with open(_plan_file(cls, directory, by_name), 'rb') as f:
+            saved = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return False
+    # Check the sources before unpickling any types, since they might not exist anymore
+    if saved['version'] != _version() or saved['sources'] != _source_digests(saved['sources']):
+        return False
+
+    entries = []
+    try:
+        for blob in saved['entries']:
+            field_type, parser_name, schemas = pickle.loads(blob)
+            entries.append((field_type, by_name[parser_name], schemas))
+    except Exception:
+        return False
+
+    for field_type, parser, schemas in entries:
+        decoder._plan.setdefault(field_type, parser)
+        for kind, schema in schemas:
+            _SCHEMAS[kind].entries.setdefault(field_type, schema)
+    return True
+
+
+def save_plan(cls: Any, directory: str | os.PathLike, parsers: Iterable[Parser] | None = None) -> Path:
+    # Resolves cls, and every type reachable from it, and writes the plan to directory
+    decoder = _get_decoder(parsers)
+    by_name = _parsers_by_name(decoder)
+    names = {id(parser): name for name, parser in by_name.items()}
+
+    entries: list[bytes] = []
+    modules: set[str] = {type(parser).__module__ for parser in decoder.parsers}
+    for field_type, parser, schemas in _walk(decoder, cls):
+        try:
+            entries.append(pickle.dumps((field_type, names[id(parser)], schemas)))
+        except Exception:  # e.g. a local class. It's introspected as usual when it's parsed
+            continue
+        if isclass(field_type):
+            # Fields (and __init__) can be inherited, so the schema also depends on the base classes
+            modules.update(klass.__module__ for klass in field_type.__mro__)
+
+    path = _plan_file(cls, directory, by_name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    saved = {'version': _version(), 'sources': _source_digests(modules), 'entries': entries}
+    # Write to a temporary file first, so another process never reads a partial plan
+    temp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    with open(temp_path, 'wb') as f:
+        pickle.dump(saved, f)
+    os.replace(temp_path, path)
+    return path
+
+
+def _walk(decoder: Decoder, cls: Any) -> Iterable[tuple[Any, Parser, list[tuple[str, Any]]]]:
+    seen: set[Any] = set()
+    pending = [cls]
+    while pending:
+        field_type = pending.pop()
+        try:
+            if field_type in seen:
+                continue
+            seen.add(field_type)
+            parser = decoder.resolve(path=_ROOT, field_type=field_type)
+        except (TypeError, ValueError):  # Unhashable, or no parser. Either way it's resolved when it's parsed
+            continue
+        if not decoder.is_planned(field_type):  # The parser depends on the path, so it's resolved every time
+            continue
+
+        schemas: list[tuple[str, Any]] = []
+        try:
+            if isinstance(parser, DataclassParser):
+                schemas.append(('dataclass', get_schema(field_type)))
+                pending.extend(field.type for field in get_schema(field_type).fields)
+            elif isinstance(parser, ClassParser):
+                schemas.append(('class', get_signature(field_type)))
+                pending.extend(parameter.annotation for parameter in get_signature(field_type).parameters)
+            elif isinstance(parser, TypedDictParser):
+                schemas.append(('typed_dict', get_typed_dict_schema(field_type)))
+                pending.extend(get_typed_dict_schema(field_type).type_hints.values())
+            elif isinstance(parser, NamedTupleParser):
+                schemas.append(('named_tuple', get_named_tuple_fields(field_type)))
+                pending.extend(sub_type for _, sub_type in get_named_tuple_fields(field_type))
+            else:
+                pending.extend(arg for arg in get_args(field_type) if arg is not Ellipsis)
+        except Exception:  # The parser raises the same error when it's used, so leave it to do that
+            schemas = []
+        yield field_type, parser, schemas
+
+
+def _parsers_by_name(decoder: Decoder) -> dict[str, Parser]:
+    # Parsers are identified by their class, since the instances only exist in this process
+    by_name: dict[str, Parser] = {}
+    for parser in decoder.parsers:
+        name = f'{type(parser).__module__}.{type(parser).__qualname__}'
+        if isinstance(parser, BaseParser):  # The builtin base type parsers share a class
+            name += f'[{parser.field_type.__module__}.{parser.field_type.__qualname__}]'
+        if name in by_name:
+            raise ValueError(f"Plans can't be cached when more than one parser is a {name}")
+        by_name[name] = parser
+    return by_name
+
+
+def _plan_file(cls: Any, directory: str | os.PathLike, by_name: dict[str, Parser]) -> Path:
+    # Generic aliases forward __qualname__ to their origin, so list[A] and list[B] are told apart by their repr
+    name = f'{cls.__module__}.{cls.__qualname__}' if isclass(cls) else repr(cls)
+    parsers_digest = hashlib.sha256('\n'.join(sorted(by_name)).encode()).hexdigest()[:16]
+    file_name = re.sub(r'[^\w.-]', '_', name)
+    return Path(directory) / f'{file_name}-{parsers_digest}.pickle'
+
+
+def _version() -> tuple[str, tuple[int, int]]:
+    return (__version__, sys.version_info[:2])
+
+
+def _source_digests(modules: Iterable[str]) -> dict[str, str | None]:
+    digests: dict[str, str | None] = {}
+    for name in modules:
+        try:
+            file = _module_file(name)
+            digests[name] = None if file is None else hashlib.sha256(Path(file).read_bytes()).hexdigest()
+        except (ImportError, ValueError, OSError):
+            digests[name] = None
+    return digests
+
+
+def _module_file(name: str) -> str | None:
+    # Modules the plan refers to might not be imported yet, when it's loaded
+    module = sys.modules.get(name)
+    if module is not None:
+        return getattr(module, '__file__', None)
+    spec = importlib.util.find_spec(name)
+    return None if spec is None or not spec.has_location else spec.origin
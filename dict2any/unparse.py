@@ -0,0 +1,169 @@
+import array
+import dataclasses
+import sys
+from collections.abc import Callable, Mapping, Sequence
+from enum import Enum
+from itertools import islice
+from operator import attrgetter
+from pathlib import PurePath
+from typing import Any
+
+from dict2any.parsers.class_parser import get_signature
+from dict2any.parsers.dataclass import get_schema
+
+Encode = Callable[[Any], Any]
+
+# Types which are already valid JSON values, and are returned as is
+PRIMITIVES = frozenset([type(None), bool, int, float, str])
+
+
+class Encoder:
+    # The reverse of a Decoder: turns dataclasses, NamedTuples, tuples, Paths etc. back into dicts, lists and primitives,
+    # which parse() accepts again.
+    # The encoder for a type is found the first time that type is seen (based on the runtime type, so unions need no
+    # special handling), and is a dict lookup after that. Lists and dicts whose items are unchanged are returned as is,
+    # rather than copied.
+    # encoders can add (or replace) the encoder for a type, and its subclasses
+    def __init__(self, encoders: Mapping[type, Encode] | None = None):
+        self.encoders = dict(encoders or {})
+        self._plan: dict[type, Encode] = {}
+
+    def unparse(self, obj: Any) -> Any:
+        cls = type(obj)
+        try:
+            encode = self._plan[cls]
+        except KeyError:
+            encode = self._plan[cls] = self._find_encoder(cls)
+        return encode(obj)
+
+    __call__ = unparse
+
+    def _find_encoder(self, cls: type) -> Encode:
+        for klass in cls.__mro__:
+            if klass in self.encoders:
+                return self.encoders[klass]
+        if cls in PRIMITIVES:
+            return _unchanged
+        if issubclass(cls, Enum):  # Before the primitives, since str(member) of a (str, Enum) is its name
+            return self._enum
+        for primitive in (bool, int, float, str):
+            if issubclass(cls, primitive):
+                return primitive
+        if dataclasses.is_dataclass(cls):
+            return self._dataclass_encoder(cls)
+        if issubclass(cls, tuple):  # Including NamedTuples
+            return self._sequence
+        if cls is list:
+            return self._list
+        if cls is dict:
+            return self._dict
+        if issubclass(cls, Mapping):
+            return self._mapping
+        if issubclass(cls, PurePath):
+            return str
+        if issubclass(cls, array.array):
+            return array.array.tolist
+        numpy = sys.modules.get('numpy')
+        if numpy is not None and issubclass(cls, (numpy.ndarray, numpy.generic)):
+            return _numpy
+        if issubclass(cls, Sequence) and not issubclass(cls, (bytes, bytearray)):
+            return self._sequence
+        # Classes whose attributes are kept in a __dict__, the way ClassParser builds them. Not e.g. datetime
+        if getattr(cls, '__dictoffset__', 0) != 0:
+            return self._class_encoder(cls)
+        raise ValueError(f'No encoder found for {cls}')
+
+    def _list(self, obj: list) -> list:
+        # Lists of primitives are checked in one pass
+        if all(map(PRIMITIVES.__contains__, map(type, obj))):
+            return obj
+        unparse = self.unparse
+        items: list | None = None
+        for index, item in enumerate(obj):
+            value = unparse(item)
+            if items is None:
+                if value is item:
+                    continue
+                items = obj[:index]
+            items.append(value)
+        return obj if items is None else items
+
+    def _sequence(self, obj: Sequence) -> list:
+        return list(map(self.unparse, obj))
+
+    def _dict(self, obj: dict) -> dict:
+        unparse = self.unparse
+        items: dict | None = None
+        for index, (key, value) in enumerate(obj.items()):
+            encoded_key = self._key(key)
+            encoded_value = unparse(value)
+            if items is None:
+                if encoded_key is key and encoded_value is value:
+                    continue
+                items = dict(islice(obj.items(), index))
+            items[encoded_key] = encoded_value
+        return obj if items is None else items
+
+    def _mapping(self, obj: Mapping) -> dict:
+        unparse = self.unparse
+        return {self._key(key): unparse(value) for key, value in obj.items()}
+
+    def _key(self, key: Any) -> Any:
+        # Keys such as Paths or enums are encoded, but a key which would become unhashable (e.g. a tuple, which is
+        # encoded as a list) is kept as it is
+        encoded = self.unparse(key)
+        if encoded is key:
+            return key
+        try:
+            hash(encoded)
+        except TypeError:
+            return key
+        return encoded
+
+    def _enum(self, obj: Enum) -> Any:
+        return self.unparse(obj.value)
+
+    def _dataclass_encoder(self, cls: type) -> Encode:
+        # Only the fields which are passed to __init__, which is what DataclassParser accepts
+        names = tuple(field.name for field in get_schema(cls).fields)
+        return self._attribute_encoder(names)
+
+    def _class_encoder(self, cls: type) -> Encode:
+        # The attributes named like the parameters of __init__, which is what ClassParser passes them as
+        names = tuple(parameter.name for parameter in get_signature(cls).parameters)
+        return self._attribute_encoder(names)
+
+    def _attribute_encoder(self, names: tuple[str, ...]) -> Encode:
+        unparse = self.unparse
+        if len(names) == 0:
+            return lambda obj: {}
+        if len(names) == 1:
+            [name] = names
+            get_value = attrgetter(name)
+            return lambda obj: {name: unparse(_get(get_value, obj))}
+        get_values = attrgetter(*names)
+        return lambda obj: dict(zip(names, map(unparse, _get(get_values, obj))))
+
+
+def _unchanged(obj: Any) -> Any:
+    return obj
+
+
+def _numpy(obj: Any) -> Any:
+    return obj.tolist()
+
+
+def _get(getter: attrgetter, obj: Any) -> Any:
+    try:
+        return getter(obj)
+    except AttributeError as e:
+        raise ValueError(f"Can't encode {type(obj)}: {e}") from e
+
+
+DEFAULT_ENCODER = Encoder()
+
+
+def unparse(obj: Any, encoders: Mapping[type, Encode] | None = None) -> Any:
+    if not encoders:
+        return DEFAULT_ENCODER.unparse(obj)
+    return Encoder(encoders).unparse(obj)
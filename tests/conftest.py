@@ -1,10 +1,14 @@
+from collections.abc import Callable, Iterable
 from inspect import isclass
 from typing import Any
 from unittest.mock import Mock
 
 import pytest
 
+from dict2any import parse
+from dict2any.codegen import compile_decoder
 from dict2any.jq_path import JqPath
+from dict2any.parsers import Parser
 
 
 @pytest.fixture
@@ -20,3 +24,15 @@ def subparser() -> Mock:
         return data
 
     return Mock(side_effect=_subparse)
+
+
+@pytest.fixture(params=['parse', 'compile'])
+def decode_with(request) -> Callable[[Iterable[Parser]], Callable[[Any, Any], Any]]:
+    # decode_with(parsers)(field_type, data) parses with the decoder, and again with the generated code, which should
+    # always give the same result
+    def make(parsers: Iterable[Parser]) -> Callable[[Any, Any], Any]:
+        if request.param == 'parse':
+            return lambda field_type, data: parse(field_type, data, parsers=parsers)
+        return lambda field_type, data: compile_decoder(field_type, parsers)(data)
+
+    return make
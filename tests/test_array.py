@@ -0,0 +1,115 @@
+import array
+from dataclasses import dataclass
+from inspect import isclass
+from typing import Annotated, Any, NamedTuple, NotRequired, TypedDict
+
+import pytest
+
+from dict2any import Typecode, parse
+from dict2any.codegen import compile_decoder
+from dict2any.jq_path import JqPath
+from dict2any.parsers import ArrayParser, NumpyArrayParser, Stage, Subparse
+
+
+@dataclass
+class Samples:
+    values: array.array
+    counts: Annotated[array.array, Typecode('i')]
+
+
+class SamplesDict(TypedDict):
+    counts: Annotated[array.array, Typecode('i')]
+    optional: NotRequired[Annotated[array.array, Typecode('i')]]
+
+
+class SamplesTuple(NamedTuple):
+    counts: Annotated[array.array, Typecode('i')]
+
+
+class SamplesClass:
+    def __init__(self, counts: Annotated[array.array, Typecode('i')]):
+        self.counts = counts
+
+
+@pytest.mark.parametrize(
+    ['stage', 'field_type', 'expected'],
+    [
+        (Stage.Exact, array.array, True),
+        (Stage.Exact, list[float], False),
+        (Stage.Fallback, Annotated[array.array, Typecode('i')], True),
+        (Stage.Fallback, Annotated[array.array, "other"], False),
+        (Stage.Fallback, Annotated[list, Typecode('i')], False),
+        (Stage.LastChance, array.array, False),
+    ],
+)
+def test_can_parse(stage: Stage, field_type: Any, expected: bool, path: JqPath):
+    assert ArrayParser().can_parse(stage=stage, path=path, field_type=field_type) == expected
+
+
+@pytest.mark.parametrize(
+    ['field_type', "data", 'expected'],
+    [
+        (array.array, [1.5, 2], array.array('d', [1.5, 2.0])),
+        (array.array, [], array.array('d')),
+        (Annotated[array.array, Typecode('i')], [1, 2], array.array('i', [1, 2])),
+        (Annotated[array.array, Typecode('b')], (1, -1), array.array('b', [1, -1])),
+        (array.array, ["a"], ValueError),
+        (array.array, "abc", ValueError),
+        (array.array, b"abcdefgh", ValueError),
+        (array.array, 5, ValueError),
+        (Annotated[array.array, Typecode('i')], [1.5], ValueError),
+        (Annotated[array.array, Typecode('b')], [1000], ValueError),
+    ],
+)
+def test_parse(field_type, data, expected, path: JqPath, subparser: Subparse):
+    if isclass(expected) and issubclass(expected, BaseException):
+        with pytest.raises(expected):
+            ArrayParser().parse(path=path, field_type=field_type, data=data, subparse=subparser)
+    else:
+        assert ArrayParser().parse(path=path, field_type=field_type, data=data, subparse=subparser) == expected
+
+
+def test_parse_nested():
+    assert parse(dict[str, Annotated[array.array, Typecode('l')]], {"a": [1, 2]}) == {"a": array.array('l', [1, 2])}
+    decode = compile_decoder(dict[str, array.array])
+    assert decode({"a": [1.5]}) == {"a": array.array('d', [1.5])}
+
+
+@pytest.mark.parametrize(
+    ['field_type', 'get_counts'],
+    [
+        (SamplesDict, lambda parsed: parsed["counts"]),
+        (SamplesTuple, lambda parsed: parsed.counts),
+        (SamplesClass, lambda parsed: parsed.counts),
+    ],
+)
+def test_typecode_of_fields(field_type: Any, get_counts: Any):
+    # Arrays compare equal by value, whatever their typecodes
+    assert get_counts(parse(field_type, {"counts": [1, 2]})).typecode == 'i'
+    assert get_counts(compile_decoder(field_type)({"counts": [1, 2]})).typecode == 'i'
+
+
+def test_typecode_of_not_required_field():
+    assert parse(SamplesDict, {"counts": [], "optional": [1]})["optional"].typecode == 'i'
+
+
+def test_numpy_not_imported(path: JqPath):
+    assert NumpyArrayParser().can_parse(stage=Stage.Exact, path=path, field_type=list) is False
+
+
+def test_numpy():
+    numpy = pytest.importorskip('numpy')
+    numpy_typing = pytest.importorskip('numpy.typing')
+
+    result = parse(numpy.ndarray, [[1.5, 2.5], [3.5, 4.5]])
+    assert result.shape == (2, 2) and result.dtype == numpy.float64
+
+    result = parse(numpy_typing.NDArray[numpy.float32], [1, 2])
+    assert result.dtype == numpy.float32 and result.tolist() == [1.0, 2.0]
+
+    with pytest.raises(ValueError):
+        parse(numpy_typing.NDArray[numpy.int64], [1.5])
+    with pytest.raises(ValueError):
+        parse(numpy.ndarray, ["a", "b"])
+    with pytest.raises(ValueError):
+        parse(numpy.ndarray, [[1], [2, 3]])
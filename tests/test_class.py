@@ -1,10 +1,12 @@
 from inspect import isclass
-from typing import Any, Optional, Union
+from typing import Annotated, Any, Optional, Union
 
 import pytest
 
+from dict2any import parse
 from dict2any.jq_path import JqPath
-from dict2any.parsers import ClassParser, Stage, Subparse
+from dict2any.parsers import ClassParser, Parser, Stage, Subparse
+from dict2any.parsers.class_parser import get_signature
 
 
 class Simple:
@@ -55,6 +57,17 @@ class MySubclass(MyClass):
         super().__init__(x=a, y=b, z=c)
 
 
+class WithStringAnnotations:
+    def __init__(self, x: 'int', y='unannotated'):
+        self.x = x
+        self.y = y
+
+
+class WithAnnotated:
+    def __init__(self, x: Annotated[str, "upper"]):
+        self.x = x
+
+
 empty = lambda x: x
 
 
@@ -99,3 +112,37 @@ def test_parse(field_type, data, expected, path: JqPath, subparser: Subparse):
             ClassParser().parse(path=path, field_type=field_type, data=data, subparse=subparser)
     else:
         assert ClassParser().parse(path=path, field_type=field_type, data=data, subparse=subparser) == expected
+
+
+def test_signature():
+    signature = get_signature(MyClassWithKwargs)
+    assert [parameter.name for parameter in signature.parameters] == ["x", "y"]
+    assert [parameter.required for parameter in signature.parameters] == [True, False]
+    assert signature.accepts_kwargs is True
+    assert signature.has_positional_only is False
+    assert get_signature(WithPositionalOnly).has_positional_only is True
+
+
+def test_signature_resolves_annotations():
+    assert [parameter.annotation for parameter in get_signature(WithStringAnnotations).parameters] == [int, Any]
+
+
+def test_signature_is_cached():
+    assert get_signature(MyClass) is get_signature(MyClass)
+
+
+def test_signature_keeps_annotated():
+    assert [parameter.annotation for parameter in get_signature(WithAnnotated).parameters] == [Annotated[str, "upper"]]
+
+
+def test_annotated_parameters_reach_custom_parsers():
+    class UpperParser(Parser):
+        stages = (Stage.Override,)
+
+        def can_parse(self, *, stage, path, field_type):
+            return getattr(field_type, '__metadata__', None) == ("upper",)
+
+        def parse(self, *, path, field_type, data, subparse):
+            return data.upper()
+
+    assert parse(WithAnnotated, {"x": "a"}, parsers=[UpperParser(), ClassParser()]).x == "A"
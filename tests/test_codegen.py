@@ -0,0 +1,215 @@
+import array
+import importlib.util
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Annotated,
+    Any,
+    Literal,
+    NamedTuple,
+    NotRequired,
+    Optional,
+    TypedDict,
+    Union,
+)
+
+import pytest
+
+from dict2any import Discriminator, parse
+from dict2any.codegen import compile_decoder, generate_module, generate_source
+from dict2any.jq_path import JqPath
+from dict2any.parsers import (
+    DataclassParser,
+    IntParser,
+    ListParser,
+    Parser,
+    Stage,
+    StringParser,
+)
+from tests.test_union import Cat, Dog, Untagged
+
+
+@dataclass
+class Inner:
+    x: int
+    tags: list[str] = field(default_factory=list)
+
+
+@dataclass
+class WithFallback:
+    kind: Literal['a']
+    # ArrayParser isn't generated, so it's reached through the decoder
+    values: array.array
+
+
+class MyTypedDict(TypedDict):
+    a: int
+    b: NotRequired[str]
+
+
+class MyPartialTypedDict(TypedDict, total=False):
+    a: int
+
+
+class MyNamedTuple(NamedTuple):
+    a: int
+    b: str
+
+
+class Plain:
+    def __init__(self, x: int, y: str = "default", **kwargs: Any):
+        self.x = x
+        self.y = y
+        self.kwargs = kwargs
+
+    def __eq__(self, other):
+        return isinstance(other, Plain) and vars(self) == vars(other)
+
+
+@dataclass
+class Tree:
+    value: int
+    children: 'list[Tree]'
+
+
+@dataclass
+class Outer:
+    inner: Inner
+    optional: Optional[Inner] = None
+    mapping: dict[str, float] = field(default_factory=dict)
+    pair: tuple[int, str] = (0, "")
+    numbers: tuple[int, ...] = ()
+    path: Path = Path(".")
+    typed_dict: Optional[MyTypedDict] = None
+    named_tuple: Optional[MyNamedTuple] = None
+    plain: Optional[Plain] = None
+    anything: Any = None
+    ordered: OrderedDict = field(default_factory=OrderedDict)
+    either: Union[int, str] = 0
+
+
+@pytest.mark.parametrize(
+    ['field_type', 'data'],
+    [
+        (Outer, {"inner": {"x": 1}}),
+        (
+            Outer,
+            {
+                "inner": {"x": 1, "tags": ["a"]},
+                "optional": {"x": 2},
+                "mapping": {"a": 1.5},
+                "pair": [1, "s"],
+                "numbers": [1, 2, 3],
+                "path": "a/b",
+                "typed_dict": {"a": 1, "b": "x"},
+                "named_tuple": [1, "s"],
+                "plain": {"x": 1, "extra": 2},
+                "anything": object,
+                "ordered": {"q": 1},
+                "either": "s",
+            },
+        ),
+        (Outer, {"inner": {"x": "not_an_int"}}),
+        (Outer, {"inner": {"x": 1}, "unknown": 1}),
+        (Outer, {}),
+        (Outer, []),
+        (Outer, {"inner": {"x": 1}, "typed_dict": {"a": 1, "c": 2}}),
+        (Outer, {"inner": {"x": 1}, "named_tuple": {"a": 1, "b": "x"}}),
+        (Outer, {"inner": {"x": 1}, "named_tuple": {"a": 1}}),
+        (Outer, {"inner": {"x": 1}, "pair": [1]}),
+        (Outer, {"inner": {"x": 1}, "either": None}),
+        (Outer, {"inner": {"x": 1}, "plain": {"y": "missing_x"}}),
+        (Outer, {"inner": {"x": 1}, "path": 5}),
+        (Tree, {"value": 1, "children": [{"value": 2, "children": []}]}),
+        (MyPartialTypedDict, {"a": 1, "extra": True}),
+        (MyTypedDict, {"a": 1}),
+        (MyTypedDict, {"b": "missing_a"}),
+        (int, True),
+        (int, "not_an_int"),
+        (None.__class__, None),
+        (list[int], [1, 2]),
+        (list, [1, "a"]),
+        (list, "abc"),
+        (dict, {1: 2}),
+        (tuple, [1, 2]),
+        (Any, object),
+        (int | str, "a"),
+        (list[int] | dict[str, int], {"a": 1}),
+        (list[int] | dict[str, int], "abc"),
+        (Inner | None, {"x": "not_an_int"}),
+        (Cat | Dog, {"kind": "dog"}),
+        (Cat | Dog, {"kind": "cat", "lives": 1}),
+        (Cat | Dog | None, None),
+        (Cat | Dog, {"kind": "fish"}),
+        (Cat | Dog, {"kind": []}),
+        (Cat | Dog, {"lives": 1}),
+        (Annotated[Cat | Dog, Discriminator('kind')], {"kind": "cat", "lives": 1}),
+        (Annotated[Cat | Dog, Discriminator('kind')], {}),
+        (Annotated[Cat | Untagged, Discriminator('kind')], {"lives": 1}),
+        (Literal["a", "b"], "b"),
+        (Literal["a", "b"], "c"),
+        (list[float], [1.5, 2.5]),
+        (list[float], [1.5, 2]),
+        (list[str], "ab"),
+    ],
+)
+def test_matches_parse(field_type: Any, data: Any):
+    try:
+        expected = parse(field_type, data)
+    except ValueError as e:
+        with pytest.raises(ValueError) as error:
+            compile_decoder(field_type)(data)
+        assert str(error.value) == str(e)
+    else:
+        assert compile_decoder(field_type)(data) == expected
+
+
+def test_is_cached():
+    assert compile_decoder(Outer) is compile_decoder(Outer)
+
+
+def test_no_dispatch_in_generated_code():
+    source, _ = generate_source(Outer)
+    assert 'subparse' not in source
+    assert '.child(' not in source
+
+
+def test_custom_parsers_are_called_with_the_path():
+    paths = []
+
+    class CustomParser(Parser):
+        stages = (Stage.Override,)
+        dispatch_types = {Stage.Override: (str,)}
+
+        def can_parse(self, *, stage, path, field_type):
+            return stage == Stage.Override and field_type is str
+
+        def parse(self, *, path: JqPath, field_type, data, subparse):
+            paths.append(path.path())
+            return data.upper()
+
+    decoder = compile_decoder(
+        list[Inner], parsers=[CustomParser(), StringParser(), IntParser(), DataclassParser(), ListParser()]
+    )
+    assert decoder([{"x": 1, "tags": ["a", "b"]}]) == [Inner(x=1, tags=["A", "B"])]
+    assert paths == ['.[0].tags.[0]', '.[0].tags.[1]']
+
+
+def test_missing_parser_raises_when_reached():
+    decoder = compile_decoder(Optional[list[Inner]], parsers=[IntParser()])
+    with pytest.raises(ValueError, match="No parser found"):
+        decoder(None)
+
+
+def test_generated_module_falls_back_to_the_default_decoder(tmp_path: Path):
+    source = generate_module(WithFallback, 'test')
+    assert 'from dict2any.parse import DEFAULT_DECODER' in source
+    path = tmp_path / 'decoder.py'
+    path.write_text(source)
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    data = {"kind": "a", "values": [1.5, 2]}
+    assert module.decode(data) == parse(WithFallback, data)
@@ -4,9 +4,10 @@ from typing import Any
 
 import pytest
 
+from dict2any import default_parsers, parse
 from dict2any.jq_path import JqPath
 from dict2any.parsers import Stage, Subparse
-from dict2any.parsers.dataclass import DataclassParser
+from dict2any.parsers.dataclass import DataclassParser, get_schema
 
 
 @dataclass
@@ -35,6 +36,12 @@ class MyDataclass:
         self.not_in_init = "not_in_init"
 
 
+@dataclass
+class StringAnnotations:
+    a: 'int'
+    b: 'list[str]' = field(default_factory=list)
+
+
 @pytest.mark.parametrize(
     ['stage', 'field_type', 'expected'],
     [
@@ -65,6 +72,8 @@ def test_can_parse(stage: Stage, field_type: Any, expected: bool, path: JqPath):
             MyDataclass(a=1, b="hello", optional_custom=custom),
         ),
         (MyDataclass, {"a": "not_an_int", "b": "hello"}, ValueError),
+        (StringAnnotations, {"a": 1}, StringAnnotations(a=1)),
+        (StringAnnotations, {"a": "not_an_int"}, ValueError),
     ],
 )
 def test_parse(field_type, data, expected, path: JqPath, subparser: Subparse):
@@ -73,3 +82,76 @@ def test_parse(field_type, data, expected, path: JqPath, subparser: Subparse):
             DataclassParser().parse(path=path, field_type=field_type, data=data, subparse=subparser)
     else:
         assert DataclassParser().parse(path=path, field_type=field_type, data=data, subparse=subparser) == expected
+
+
+def test_schema():
+    schema = get_schema(MyDataclass)
+    assert [field.name for field in schema.fields] == ["a", "b", "optional_str", "optional_list", "optional_custom"]
+    assert schema.required == frozenset(["a", "b"])
+    assert get_schema(MyDataclass) is schema
+
+
+def test_schema_resolves_string_annotations():
+    assert [field.type for field in get_schema(StringAnnotations).fields] == [int, list[str]]
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenSlotted:
+    a: int
+    inner: EmptyDataclass
+    tags: list[str] = field(default_factory=list)
+
+
+@dataclass
+class WithDefaults:
+    a: int
+    b: str | None = None
+    items: list[int] = field(default_factory=list)
+
+
+@dataclass
+class WithPostInit:
+    a: int
+    doubled: int = field(init=False, default=0)
+    computed: int = field(init=False)
+
+    def __post_init__(self):
+        self.doubled = self.a * 2
+
+
+def test_trusted(decode_with):
+    run = decode_with(default_parsers(DataclassParser(trusted=True)))
+
+    assert run(FrozenSlotted, {"a": 1, "inner": {}}) == FrozenSlotted(a=1, inner=EmptyDataclass())
+    result = run(FrozenSlotted, {"a": 1, "inner": {}, "tags": ["x"]})
+    assert result.tags == ["x"] and type(result.inner) is EmptyDataclass
+    assert run(WithDefaults, {"a": 1}) == WithDefaults(a=1)
+    assert run(WithDefaults, {"a": 1}).items is not run(WithDefaults, {"a": 1}).items
+
+    # __post_init__ isn't called, but init=False fields with a default are still set
+    result = run(WithPostInit, {"a": 2})
+    assert result.a == 2 and result.doubled == 0 and not hasattr(result, 'computed')
+
+    # Fields which would be returned unchanged aren't type checked
+    assert run(FrozenSlotted, {"a": "not_an_int", "inner": {}}).a == "not_an_int"
+    # But everything else still is
+    with pytest.raises(ValueError):
+        run(FrozenSlotted, {"a": 1, "inner": {"unknown": 1}})
+    with pytest.raises(ValueError, match="Missing required field: inner"):
+        run(FrozenSlotted, {"a": 1})
+    with pytest.raises(ValueError, match="Unknown keys"):
+        run(FrozenSlotted, {"a": 1, "inner": {}, "unknown": 1})
+
+
+def test_trusted_without_a_decoder(path: JqPath, subparser: Subparse):
+    parser = DataclassParser(trusted=True)
+    assert parser.parse(path=path, field_type=WithDefaults, data={"a": 1}, subparse=subparser) == WithDefaults(a=1)
+    with pytest.raises(ValueError):
+        parser.parse(path=path, field_type=WithDefaults, data={"a": "not_an_int"}, subparse=subparser)
+
+
+def test_schema_defaults():
+    schema = get_schema(WithPostInit)
+    assert [field.name for field in schema.other_defaults] == ["doubled"]
+    assert schema.uses_dict is True
+    assert get_schema(FrozenSlotted).uses_dict is False
@@ -5,9 +5,10 @@ from typing import Any, Generic, NotRequired, Required, TypedDict, TypeVar
 
 import pytest
 
+from dict2any import default_parsers, parse
 from dict2any.jq_path import JqPath
-from dict2any.parsers import Stage, Subparse
-from dict2any.parsers.dict import DictParser, TypedDictParser
+from dict2any.parsers import ListParser, Stage, Subparse
+from dict2any.parsers.dict import DictParser, TypedDictParser, get_typed_dict_schema
 
 
 class MyTypedDict(TypedDict):
@@ -193,3 +194,41 @@ def test_parse_typed_dict(field_type, data, expected, path: JqPath, subparser: S
             TypedDictParser().parse(path=path, field_type=field_type, data=data, subparse=subparser)
     else:
         assert TypedDictParser().parse(path=path, field_type=field_type, data=data, subparse=subparser) == expected
+
+
+def test_typed_dict_schema():
+    schema = get_typed_dict_schema(MyPartialTypedDict)
+    assert schema.type_hints == {"a": int, "b": str}
+    assert schema.required_keys == frozenset(["a"])
+    assert schema.optional_keys == frozenset(["b"])
+    assert schema.allow_unknown_keys is True
+    assert get_typed_dict_schema(MyPartialTypedDict) is schema
+
+
+def test_borrow(decode_with):
+    run = decode_with(default_parsers(DictParser(borrow=True), ListParser(borrow=True)))
+
+    data: Any = {"a": 1, "b": [1, 2]}
+    assert run(dict[str, Any], data) is data
+    data = {"a": {"b": 1}}
+    result = run(dict[str, dict[str, int]], data)
+    assert result is data and result["a"] is data["a"]
+
+    # Only a dict of the exact type is borrowed
+    data = OrderedDict(a=1)
+    assert type(run(OrderedDict[str, int], data)) is OrderedDict
+    assert type(run(dict[str, int], data)) is dict
+
+    # The copy starts at the first entry which changed
+    data = {"a": [1], "b": (2,), "c": [3]}
+    result = run(dict[str, list[int]], data)
+    assert result == {"a": [1], "b": [2], "c": [3]} and result is not data
+    assert result["a"] is data["a"] and result["c"] is data["c"]
+
+    with pytest.raises(ValueError):
+        run(dict[str, int], {"a": 1, "b": "not_an_int"})
+
+
+def test_borrow_is_off_by_default():
+    data = {"a": 1}
+    assert parse(dict[str, int], data) is not data
@@ -23,6 +23,10 @@ def test_parse_dot():
         '["42"]',
         '["not_a_number"]',
         'a.b.[oops.d',
+        '.a.',
+        '.[]',
+        '."unterminated',
+        '."a"b',
     ],
 )
 def test_invalid_paths(path: str):
@@ -91,3 +95,64 @@ def test_part_validity():
 def test_verify_direct_initialization():
     with pytest.raises(ValueError, match="Path must have at least one part"):
         JqPath(parts=())
+
+
+def test_child_links_to_parent():
+    parent = JqPath.parse('.a')
+    child = parent.child(index=0)
+    assert child.parent() is parent
+    assert child.parts == (JqPathPart(name=''), JqPathPart(name='a'), JqPathPart(index=0))
+
+
+def test_hash():
+    assert hash(JqPath.parse('.a.[1]')) == hash(JqPath.parse('.').child(name='a').child(index=1))
+    assert len({JqPath.parse('.a'), JqPath.parse('.').child(name='a'), JqPath.parse('.b')}) == 2
+
+
+def test_common_parts_are_shared():
+    root = JqPath.parse('.')
+    assert root.child(index=3).parts[-1] is root.child(index=3).parts[-1]
+    assert root.child(name='a').parts[-1] is root.child(name='a').parts[-1]
+    assert root.child(index=10**6).parts[-1] == JqPathPart(index=10**6)
+
+
+def test_paths_have_no_dict():
+    assert not hasattr(JqPath.parse('.a'), '__dict__')
+    assert not hasattr(JqPathPart(name='a'), '__dict__')
+
+
+def test_equality_with_shared_prefix():
+    prefix = JqPath.parse('.a.b')
+    assert prefix.child(index=1) == prefix.child(index=1)
+    assert prefix.child(index=1) != prefix.child(index=2)
+    assert prefix.child(index=1) != prefix
+
+
+def test_multi_digit_index():
+    assert JqPath.parse('.[12]').parts[-1] == JqPathPart(index=12)
+    assert JqPath.parse('.a[105].b').path() == '.a.[105].b'
+
+
+@pytest.mark.parametrize(
+    ['path', 'name', 'normalized'],
+    [
+        ('."a.b"', 'a.b', '."a.b"'),
+        ('."[0]"', '[0]', '."[0]"'),
+        ('."simple"', 'simple', '.simple'),
+        ('.""', '', '.""'),
+        ('."with \\"quotes\\""', 'with "quotes"', '."with \\"quotes\\""'),
+    ],
+)
+def test_quoted_names(path: str, name: str, normalized: str):
+    jq_path = JqPath.parse(path)
+    assert jq_path.parts[-1] == JqPathPart(name=name)
+    assert jq_path.path() == normalized
+    assert JqPath.parse(normalized) == jq_path
+
+
+def test_child_with_special_characters():
+    assert JqPath.parse('.').child(name='a.b').path() == '."a.b"'
+
+
+def test_parse_is_cached():
+    assert JqPath.parse('.a.b[0]') is JqPath.parse('.a.b[0]')
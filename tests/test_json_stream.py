@@ -0,0 +1,80 @@
+import io
+import json
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+from dict2any.jq_path import JqPath
+from dict2any.json_stream import iter_json_array, iter_parse_json_array
+
+
+@dataclass
+class Record:
+    id: int
+    name: str
+
+
+DOCUMENT: dict[str, Any] = {
+    "meta": {"skipped": [1, {"tricky": "]}\"[\\"}], "other": "value"},
+    "data": {"items": [1, 2.5, -3.25e-10, "s", None, True, False, {"k": [1, 2]}, [3], 12345678901234567890, "ünï"]},
+}
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 65536])
+@pytest.mark.parametrize(
+    ['path', 'expected'],
+    [
+        ('.data.items', DOCUMENT["data"]["items"]),
+        ('.meta.skipped', DOCUMENT["meta"]["skipped"]),
+        ('.data.items[7].k', [1, 2]),
+        ('.data.items.[8]', [3]),
+    ],
+)
+def test_iter_json_array(path: str, expected: list, chunk_size: int):
+    text = json.dumps(DOCUMENT, ensure_ascii=False)
+    assert list(iter_json_array(io.StringIO(text), path, chunk_size=chunk_size)) == expected
+    assert list(iter_json_array(io.BytesIO(text.encode()), JqPath.parse(path), chunk_size=chunk_size)) == expected
+
+
+def test_top_level_array():
+    assert list(iter_json_array(io.StringIO(' [ ] '))) == []
+    assert list(iter_json_array(io.StringIO('[1, [2], {"a": 3}]'))) == [1, [2], {"a": 3}]
+
+
+def test_is_lazy():
+    elements = iter_json_array(io.StringIO('[1, 2, oops'))
+    assert next(elements) == 1
+    assert next(elements) == 2
+    with pytest.raises(ValueError):
+        next(elements)
+
+
+@pytest.mark.parametrize(
+    ['text', 'path'],
+    [
+        ('[1,', '.'),
+        ('[1 2]', '.'),
+        ('{"a": 1}', '.'),
+        ('', '.'),
+        ('{"a": []}', '.b'),
+        ('[[1]]', '.[1]'),
+        ('{"a": 1}', '.a'),
+    ],
+)
+def test_invalid(text: str, path: str):
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO(text), path))
+
+
+def test_iter_parse_json_array():
+    text = '{"records": [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]}'
+    assert list(iter_parse_json_array(Record, io.StringIO(text), '.records')) == [
+        Record(id=1, name="a"),
+        Record(id=2, name="b"),
+    ]
+
+
+def test_iter_parse_json_array_invalid_element():
+    with pytest.raises(ValueError):
+        list(iter_parse_json_array(Record, io.StringIO('[{"id": "oops", "name": "a"}]')))
@@ -1,12 +1,15 @@
 from collections.abc import MutableSequence
 from dataclasses import dataclass, fields
+from inspect import isclass
 from typing import Any, Generic, TypeVar
 from unittest.mock import Mock
 
 import pytest
 
+from dict2any import Decoder, default_parsers, parse
+from dict2any.codegen import compile_decoder
 from dict2any.jq_path import JqPath
-from dict2any.parsers import Stage
+from dict2any.parsers import IntParser, Parser, Stage, parses_unchanged
 from dict2any.parsers.list import ListParser
 
 
@@ -139,3 +142,113 @@ def test_parse_fails_for_non_lists(path: JqPath, subparser: Mock):
 
     with pytest.raises(ValueError):
         ListParser().parse(path=path, field_type=list, data={"hello": "world"}, subparse=subparser)
+
+
+@pytest.mark.parametrize(
+    ['field_type', "data", 'expected'],
+    [
+        (list[float], [1.5, 2.5], [1.5, 2.5]),
+        (list[int], [1, True], [1, True]),
+        (list[str], "ab", ["a", "b"]),
+        (list[Any], [1, "a", None], [1, "a", None]),
+        (list, (1, "a"), [1, "a"]),
+        (list[int], [], []),
+        (list[float], [1.5, 2], ValueError),
+        (list[None], [None, 0], ValueError),
+    ],
+)
+def test_parse_primitives_in_bulk(field_type, data, expected):
+    if isclass(expected) and issubclass(expected, BaseException):
+        with pytest.raises(expected):
+            parse(field_type, data)
+    else:
+        result = parse(field_type, data)
+        assert result == expected
+        assert type(result) is list and result is not data
+
+
+def test_bulk_parse_does_not_subparse_items():
+    class CountingDecoder(Decoder):
+        def subparse(self, *, path, field_type, data):
+            calls.append(field_type)
+            return super().subparse(path=path, field_type=field_type, data=data)
+
+        __call__ = subparse
+
+    calls: list[Any] = []
+    assert CountingDecoder().parse(list[int], [1, 2, 3]) == [1, 2, 3]
+    assert calls == [list[int]]
+
+
+def test_bulk_parse_error_is_for_the_first_invalid_item():
+    paths = []
+
+    class RecordingIntParser(IntParser):
+        def parse(self, *, path, field_type, data, subparse):
+            paths.append(path.path())
+            return super().parse(path=path, field_type=field_type, data=data, subparse=subparse)
+
+    # Parsers which override parse are still called for every item
+    assert Decoder([ListParser(), RecordingIntParser()]).parse(list[int], [1, 2]) == [1, 2]
+    assert paths == ['.[0]', '.[1]']
+    with pytest.raises(ValueError, match="Invalid type: <class 'str'>"):
+        parse(list[int], [1, "a", None])
+
+
+def test_borrow(decode_with):
+    run = decode_with(default_parsers(ListParser(borrow=True)))
+
+    data: Any = ["a", "b"]
+    assert run(list[str], data) is data
+    data = [1, "a", None]
+    assert run(list[Any], data) is data
+    data = [[1], [2]]
+    result = run(list[list[int]], data)
+    assert result is data and result[0] is data[0]
+
+    # Only a list of the exact type is borrowed
+    data = ("a", "b")
+    assert run(list[str], data) == ["a", "b"]
+    data = ["a", "b"]
+    assert run(SubList, data) == SubList(["a", "b"]) and type(run(SubList, data)) is SubList
+
+    # The copy starts at the first item which changed
+    data = [[1], (2,), [3]]
+    result = run(list[list[int]], data)
+    assert result == [[1], [2], [3]] and result is not data
+    assert result[0] is data[0] and result[2] is data[2]
+
+
+def test_borrow_is_off_by_default():
+    data = ["a", "b"]
+    assert parse(list[str], data) is not data
+
+
+def test_custom_sequences_dont_keep_the_input(decode_with):
+    run = decode_with(default_parsers(ListParser(borrow=True)))
+
+    data = [1, 2]
+    assert run(MyCustomSequence, data).items is not data
+    assert run(MyGenericCustomSequence[int], data).items is not data
+    assert run(MyGenericCustomSequence[int], (1, 2)) == MyGenericCustomSequence([1, 2])
+
+
+def test_custom_parsers_which_parse_unchanged():
+    class IdParser(Parser):
+        stages = (Stage.Exact,)
+        dispatch_types = {Stage.Exact: (int | str,)}
+        input_types = (int, str)
+
+        def can_parse(self, *, stage, path, field_type):
+            return False
+
+        @parses_unchanged
+        def parse(self, *, path, field_type, data, subparse):
+            raise AssertionError("Items are checked in one pass instead")
+
+    parsers = [ListParser(), IdParser()]
+    assert parse(list[int | str], [1, "a"], parsers=parsers) == [1, "a"]
+    assert compile_decoder(list[int | str], parsers)([1, "a"]) == [1, "a"]
+    assert compile_decoder(int | str, parsers)("a") == "a"
+    with pytest.raises(ValueError, match="Invalid type"):
+        compile_decoder(int | str, parsers)(None)
@@ -0,0 +1,40 @@
+from inspect import isclass
+from typing import Any, Literal
+
+import pytest
+
+from dict2any.jq_path import JqPath
+from dict2any.parsers import LiteralParser, Stage, Subparse
+
+
+@pytest.mark.parametrize(
+    ['stage', 'field_type', 'expected'],
+    [
+        (Stage.Exact, Literal["a"], True),
+        (Stage.Exact, Literal[1, 2], True),
+        (Stage.Exact, str, False),
+        (Stage.Fallback, Literal["a"], False),
+    ],
+)
+def test_can_parse(stage: Stage, field_type: Any, expected: bool, path: JqPath):
+    assert LiteralParser().can_parse(stage=stage, path=path, field_type=field_type) == expected
+
+
+@pytest.mark.parametrize(
+    ['field_type', "data", 'expected'],
+    [
+        (Literal["a"], "a", "a"),
+        (Literal["a", "b"], "b", "b"),
+        (Literal[1, 2], 2, 2),
+        (Literal["a"], "c", ValueError),
+        (Literal[1], True, ValueError),
+        (Literal[1], 1.0, ValueError),
+        (Literal["a"], ["a"], ValueError),
+    ],
+)
+def test_parse(field_type, data, expected, path: JqPath, subparser: Subparse):
+    if isclass(expected) and issubclass(expected, BaseException):
+        with pytest.raises(expected):
+            LiteralParser().parse(path=path, field_type=field_type, data=data, subparse=subparser)
+    else:
+        assert LiteralParser().parse(path=path, field_type=field_type, data=data, subparse=subparser) == expected
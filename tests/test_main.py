@@ -0,0 +1,96 @@
+import importlib.util
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from dict2any import parse
+from dict2any.__main__ import main
+from tests.test_array import Samples
+from tests.test_codegen import Outer, Tree
+from tests.test_union import Zoo
+
+
+def load_module(path: Path) -> Any:
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize(
+    ['target', 'data'],
+    [
+        (
+            'tests.test_codegen:Outer',
+            {
+                "inner": {"x": 1, "tags": ["a"]},
+                "optional": None,
+                "mapping": {"a": 1.5},
+                "pair": [1, "b"],
+                "numbers": [1, 2],
+                "path": "/tmp",
+                "typed_dict": {"a": 1},
+                "named_tuple": [1, "b"],
+                "plain": {"x": 1, "extra": 2},
+                "either": "text",
+            },
+        ),
+        ('tests.test_codegen:Tree', {"value": 1, "children": [{"value": 2, "children": []}]}),
+    ],
+)
+def test_compile(target: str, data: Any, tmp_path: Path):
+    output = tmp_path / 'decoder.py'
+    assert main(['compile', target, '-o', str(output)]) == 0
+    module = load_module(output)
+    field_type = {'tests.test_codegen:Outer': Outer, 'tests.test_codegen:Tree': Tree}[target]
+    assert module.decode(data) == parse(field_type, data)
+
+
+def test_compiled_module_errors(tmp_path: Path):
+    output = tmp_path / 'decoder.py'
+    assert main(['compile', 'tests.test_codegen:Outer', '-o', str(output)]) == 0
+    with pytest.raises(ValueError, match="Missing required field: x"):
+        load_module(output).decode({"inner": {}})
+
+
+def test_compile_to_stdout(capsys):
+    assert main(['compile', 'tests.test_codegen:Tree']) == 0
+    assert 'def decode(data):' in capsys.readouterr().out
+
+
+def test_check(tmp_path: Path):
+    output = tmp_path / 'decoder.py'
+    assert main(['compile', 'tests.test_codegen:Tree', '-o', str(output), '--check']) == 1
+    assert main(['compile', 'tests.test_codegen:Tree', '-o', str(output)]) == 0
+    assert main(['compile', 'tests.test_codegen:Tree', '-o', str(output), '--check']) == 0
+    output.write_text(output.read_text() + '# edited\n')
+    assert main(['compile', 'tests.test_codegen:Tree', '-o', str(output), '--check']) == 1
+
+
+def test_output_is_deterministic(tmp_path: Path):
+    first = tmp_path / 'first.py'
+    second = tmp_path / 'second.py'
+    assert main(['compile', 'tests.test_codegen:Outer', '-o', str(first)]) == 0
+    assert main(['compile', 'tests.test_codegen:Outer', '-o', str(second)]) == 0
+    assert first.read_text().splitlines()[1:] == second.read_text().splitlines()[1:]
+
+
+def test_invalid_target():
+    with pytest.raises(SystemExit):
+        main(['compile', 'no_colon'])
+
+
+def test_compile_discriminated_union(tmp_path: Path):
+    output = tmp_path / 'decoder.py'
+    assert main(['compile', 'tests.test_union:Zoo', '-o', str(output)]) == 0
+    data = {"animals": [{"kind": "cat", "lives": 9}, {"kind": "dog"}], "favourite": {"kind": "dog"}}
+    assert load_module(output).decode(data) == parse(Zoo, data)
+
+
+def test_compile_with_parsers_which_arent_generated(tmp_path: Path):
+    output = tmp_path / 'decoder.py'
+    assert main(['compile', 'tests.test_array:Samples', '-o', str(output)]) == 0
+    data = {"values": [1.5, 2], "counts": [1, 2]}
+    assert load_module(output).decode(data) == parse(Samples, data)
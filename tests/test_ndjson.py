@@ -0,0 +1,97 @@
+import io
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from dict2any.ndjson import (
+    iter_parse_ndjson,
+    iter_parse_ndjson_batches,
+    parse_ndjson_parallel,
+)
+
+
+@dataclass
+class Record:
+    id: int
+    name: str
+
+
+NDJSON = b'{"id": 1, "name": "a"}\n\n{"id": 2, "name": "b"}\n{"id": 3, "name": "c"}'
+RECORDS = [Record(id=1, name="a"), Record(id=2, name="b"), Record(id=3, name="c")]
+
+
+def count_records(records) -> int:
+    return sum(1 for _ in records)
+
+
+def test_binary_stream():
+    assert list(iter_parse_ndjson(Record, io.BytesIO(NDJSON))) == RECORDS
+
+
+def test_text_stream():
+    assert list(iter_parse_ndjson(Record, io.StringIO(NDJSON.decode()))) == RECORDS
+
+
+def test_file(tmp_path: Path):
+    path = tmp_path / "records.ndjson"
+    path.write_bytes(NDJSON)
+    assert list(iter_parse_ndjson(Record, path)) == RECORDS
+    assert list(iter_parse_ndjson(Record, str(path))) == RECORDS
+
+
+def test_is_lazy():
+    parsed = iter_parse_ndjson(Record, io.BytesIO(NDJSON + b'\nnot json'))
+    assert next(parsed) == RECORDS[0]
+    with pytest.raises(ValueError, match="Invalid JSON on line 5"):
+        list(parsed)
+
+
+def test_invalid_record():
+    with pytest.raises(ValueError):
+        list(iter_parse_ndjson(Record, io.BytesIO(b'{"id": "oops", "name": "a"}')))
+
+
+@pytest.mark.parametrize(
+    ['batch_size', 'expected'],
+    [
+        (1, [[RECORDS[0]], [RECORDS[1]], [RECORDS[2]]]),
+        (2, [RECORDS[:2], RECORDS[2:]]),
+        (5, [RECORDS]),
+    ],
+)
+def test_batches(batch_size: int, expected: list):
+    assert list(iter_parse_ndjson_batches(Record, io.BytesIO(NDJSON), batch_size=batch_size)) == expected
+
+
+def test_invalid_batch_size():
+    with pytest.raises(ValueError):
+        list(iter_parse_ndjson_batches(Record, io.BytesIO(NDJSON), batch_size=0))
+
+
+@pytest.mark.parametrize('chunk_bytes', [None, 1, 10, 30, 10_000])
+def test_parse_ndjson_parallel(tmp_path: Path, chunk_bytes: int | None):
+    path = tmp_path / "records.ndjson"
+    records = [Record(id=i, name=str(i)) for i in range(100)]
+    path.write_text("\n".join(f'{{"id": {record.id}, "name": "{record.name}"}}' for record in records) + "\n")
+    assert parse_ndjson_parallel(Record, path, max_workers=2, chunk_bytes=chunk_bytes) == records
+
+
+def test_parse_ndjson_parallel_reducer(tmp_path: Path):
+    path = tmp_path / "records.ndjson"
+    path.write_bytes(NDJSON)
+    counts = parse_ndjson_parallel(Record, path, max_workers=2, chunk_bytes=1, reducer=count_records)
+    assert sum(counts) == 3
+
+
+def test_parse_ndjson_parallel_empty(tmp_path: Path):
+    path = tmp_path / "records.ndjson"
+    path.write_bytes(b"")
+    assert parse_ndjson_parallel(Record, path, max_workers=1) == []
+
+
+def test_parse_ndjson_parallel_invalid(tmp_path: Path):
+    path = tmp_path / "records.ndjson"
+    path.write_bytes(NDJSON + b'\n{"id": "oops", "name": "d"}')
+    with pytest.raises(ValueError, match="byte offset 70"):
+        parse_ndjson_parallel(Record, path, max_workers=1)
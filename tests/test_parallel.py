@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+
+import pytest
+
+from dict2any.parallel import (
+    ParallelDecoder,
+    ParallelOverheadWarning,
+    ParallelStats,
+    parse_parallel,
+    worker_parse,
+)
+from dict2any.parsers import IntParser, Parser, Stage
+
+
+@dataclass
+class Record:
+    id: int
+    name: str
+
+
+class DoublingParser(Parser):
+    stages = (Stage.Override,)
+    dispatch_types = {Stage.Override: (int,)}
+
+    def can_parse(self, *, stage, path, field_type):
+        return stage == Stage.Override and field_type is int
+
+    def parse(self, *, path, field_type, data, subparse):
+        return data * 2
+
+
+@pytest.mark.filterwarnings("ignore::dict2any.parallel.ParallelOverheadWarning")
+def test_parse_parallel_keeps_order():
+    items = [{"id": i, "name": str(i)} for i in range(50)]
+    assert parse_parallel(Record, items, chunk_size=7, max_workers=2) == [Record(id=i, name=str(i)) for i in range(50)]
+
+
+@pytest.mark.filterwarnings("ignore::dict2any.parallel.ParallelOverheadWarning")
+def test_parse_parallel_custom_parsers():
+    assert parse_parallel(int, [1, 2, 3], parsers=[DoublingParser(), IntParser()], max_workers=1) == [2, 4, 6]
+
+
+@pytest.mark.filterwarnings("ignore::dict2any.parallel.ParallelOverheadWarning")
+def test_parse_parallel_error():
+    with pytest.raises(ValueError):
+        parse_parallel(Record, [{"id": 1, "name": "a"}, {"id": "oops", "name": "b"}], max_workers=1)
+
+
+def test_parse_parallel_empty():
+    assert parse_parallel(Record, [], max_workers=1) == []
+
+
+def test_stats_warn_on_overhead():
+    with ParallelDecoder(Record, max_workers=1) as decoder:
+        with pytest.warns(ParallelOverheadWarning):
+            # Tiny chunks are all overhead
+            decoder.parse_many([{"id": i, "name": str(i)} for i in range(10)], chunk_size=1)
+        assert decoder.last_stats is not None
+        assert decoder.last_stats.items == 10
+        assert decoder.last_stats.chunks == 10
+        assert decoder.last_stats.overhead_dominates
+
+
+def test_invalid_chunk_size():
+    with ParallelDecoder(Record, max_workers=1) as decoder:
+        with pytest.raises(ValueError):
+            decoder.parse_many([{"id": 1, "name": "a"}], chunk_size=0)
+
+
+def test_stats():
+    stats = ParallelStats(items=10, chunks=2, chunk_size=5, wall_time=1.0, decode_time=3.0)
+    assert stats.speedup == 3.0
+    assert not stats.overhead_dominates
+
+
+def test_worker_parse_outside_a_pool():
+    with pytest.raises(RuntimeError, match="init_worker"):
+        worker_parse({"id": 1, "name": "a"})
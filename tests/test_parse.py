@@ -4,8 +4,16 @@ from typing import Any
 
 import pytest
 
-from dict2any import parse
-from dict2any.parsers import Parser
+from dict2any import (
+    DEFAULT_PARSERS,
+    Decoder,
+    default_parsers,
+    iter_parse,
+    parse,
+    parse_many,
+)
+from dict2any.codegen import compile_decoder
+from dict2any.parsers import DataclassParser, IntParser, ListParser, Parser, Stage
 
 
 class Custom:
@@ -60,3 +68,182 @@ def test_parse_with_custom_parser():
             return "custom"
 
     assert parse(str, {}, parsers=[CustomParser()]) == "custom"
+
+
+def test_parser_resolution_is_cached():
+    class CountingParser(Parser):
+        def __init__(self):
+            self.can_parse_calls = 0
+
+        def can_parse(self, stage, path, field_type):
+            self.can_parse_calls += 1
+            return field_type is int
+
+        def parse(self, path, field_type, data, subparse):
+            return data
+
+    parser = CountingParser()
+    parsers = [parser]
+    assert parse(int, 1, parsers=parsers) == 1
+    calls = parser.can_parse_calls
+    assert parse(int, 2, parsers=parsers) == 2
+    assert parse(int, 3, parsers=parsers) == 3
+    assert parser.can_parse_calls == calls
+
+
+def test_path_dependent_parsers_are_asked_at_every_path():
+    class IdParser(Parser):
+        stages = (Stage.Override,)
+        path_dependent = True
+
+        def can_parse(self, stage, path, field_type):
+            return field_type is int and path.path() == '.id'
+
+        def parse(self, path, field_type, data, subparse):
+            return data * 10
+
+    @dataclass
+    class Record:
+        id: int
+        count: int
+
+    decoder = Decoder([IdParser(), IntParser(), DataclassParser()])
+    assert decoder.parse(Record, {"id": 1, "count": 2}) == Record(id=10, count=2)
+    assert decoder.parse(Record, {"count": 3, "id": 4}) == Record(id=40, count=3)
+    assert decoder.is_planned(Record) is False
+    assert compile_decoder(Record, decoder.parsers)({"id": 5, "count": 6}) == Record(id=50, count=6)
+
+
+def test_missing_parser_is_not_cached():
+    with pytest.raises(ValueError, match="No parser found"):
+        parse(type(my_function), {})
+    with pytest.raises(ValueError, match="No parser found"):
+        parse(type(my_function), {})
+
+
+def test_decoder():
+    decoder = Decoder()
+    assert decoder.parse(Outer, {"inner": {"inner": 1}, "outer": 2}) == Outer(inner=Inner(inner=1), outer=2)
+    assert decoder.parse(list[int], [1, 2]) == [1, 2]
+
+
+def test_decoder_detects_ambiguous_dispatch_types():
+    with pytest.raises(ValueError, match="Ambiguous parsers"):
+        Decoder([IntParser(), IntParser()])
+
+
+def test_decoder_detects_ambiguous_parsers():
+    class AlwaysParser(Parser):
+        def can_parse(self, stage, path, field_type):
+            return True
+
+        def parse(self, path, field_type, data, subparse):
+            return data
+
+    decoder = Decoder([AlwaysParser(), AlwaysParser()])
+    with pytest.raises(ValueError, match="Ambiguous parsers"):
+        decoder.parse(int, 1)
+
+
+@pytest.mark.parametrize('field_type', [int, list[int]])
+def test_decoder_detects_parsers_which_are_ambiguous_with_dispatch_types(field_type: Any):
+    class IntsParser(Parser):
+        stages = (Stage.Exact,)
+
+        def can_parse(self, stage, path, field_type):
+            return field_type in (int, list[int])
+
+        def parse(self, path, field_type, data, subparse):
+            return data
+
+    with pytest.raises(ValueError, match="Ambiguous parsers"):
+        parse(field_type, [1], parsers=[*DEFAULT_PARSERS, IntsParser()])
+
+
+def test_decoder_dispatch_types_skip_can_parse():
+    class DispatchParser(Parser):
+        stages = (Stage.Exact,)
+        dispatch_types = {Stage.Exact: (int,)}
+        dispatch_origins = {Stage.Exact: (list,)}
+
+        def can_parse(self, stage, path, field_type):
+            raise AssertionError()
+
+        def parse(self, path, field_type, data, subparse):
+            return "dispatched"
+
+    decoder = Decoder([DispatchParser()])
+    assert decoder.parse(int, 1) == "dispatched"
+    assert decoder.parse(list[str], []) == "dispatched"
+
+
+def test_decoder_only_asks_declared_stages():
+    class ExactOnlyParser(Parser):
+        stages = (Stage.Exact,)
+
+        def __init__(self):
+            self.stages_seen = []
+
+        def can_parse(self, stage, path, field_type):
+            self.stages_seen.append(stage)
+            return False
+
+        def parse(self, path, field_type, data, subparse):
+            raise AssertionError()
+
+    parser = ExactOnlyParser()
+    assert Decoder([parser, IntParser(), DataclassParser()]).parse(Inner, {"inner": 1}) == Inner(inner=1)
+    # Asked about Inner, and about int (to check it doesn't clash with the IntParser), but only in its own stage
+    assert parser.stages_seen == [Stage.Exact, Stage.Exact]
+
+
+def test_parse_many():
+    assert parse_many(Inner, [{"inner": 1}, {"inner": 2}]) == [Inner(inner=1), Inner(inner=2)]
+    assert parse_many(Inner, []) == []
+
+
+def test_iter_parse_is_lazy():
+    def items():
+        yield {"inner": 1}
+        yield {"inner": "not_an_int"}
+
+    parsed = iter_parse(Inner, items())
+    assert next(parsed) == Inner(inner=1)
+    with pytest.raises(ValueError):
+        next(parsed)
+
+
+def test_parse_many_paths():
+    paths = []
+
+    class RecordingParser(Parser):
+        def can_parse(self, stage, path, field_type):
+            return True
+
+        def parse(self, path, field_type, data, subparse):
+            paths.append(path.path())
+            return data
+
+    assert Decoder([RecordingParser()]).parse_many(int, [1, 2]) == [1, 2]
+    assert paths == ['.[0]', '.[1]']
+
+
+def test_default_parsers():
+    assert set(default_parsers()) == set(DEFAULT_PARSERS)
+    borrowing = ListParser(borrow=True)
+    parsers = default_parsers(borrowing)
+    assert len(parsers) == len(DEFAULT_PARSERS)
+    assert borrowing in parsers
+    assert [p for p in parsers if isinstance(p, ListParser)] == [borrowing]
+
+
+def test_default_parsers_rejects_unknown_parsers():
+    class OtherParser(Parser):
+        def can_parse(self, stage, path, field_type):
+            return False
+
+        def parse(self, path, field_type, data, subparse):
+            return data
+
+    with pytest.raises(ValueError, match="replace"):
+        default_parsers(OtherParser())
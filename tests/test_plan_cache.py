@@ -0,0 +1,141 @@
+import importlib
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from dict2any import Decoder, parse
+from dict2any.parsers import DataclassParser, IntParser, ListParser, StringParser
+from dict2any.parsers.class_parser import get_signature
+from dict2any.parsers.dataclass import get_schema
+from dict2any.parsers.dict import get_typed_dict_schema
+from dict2any.parsers.tuple import get_named_tuple_fields
+from dict2any.parsers.type_cache import TypeCache
+from dict2any.plan_cache import load_plan, save_plan, warm_plan
+from tests.test_codegen import Outer
+
+MODULE_SOURCE = '''
+from dataclasses import dataclass
+
+
+@dataclass
+class Config:
+    name: str
+    values: list[int]
+'''
+
+BASE_SOURCE = '''
+from dataclasses import dataclass
+
+
+@dataclass
+class Base:
+    x: int
+'''
+
+CHILD_SOURCE = '''
+from dataclasses import dataclass
+
+from plan_cache_base import Base
+
+
+@dataclass
+class Child(Base):
+    y: int
+'''
+
+SCHEMAS: list[TypeCache] = [get_schema, get_signature, get_typed_dict_schema, get_named_tuple_fields]
+
+
+@pytest.fixture
+def fresh_caches(monkeypatch):
+    # Pretend to be a new process, with nothing introspected yet
+    for schema in SCHEMAS:
+        monkeypatch.setattr(schema, 'entries', {})
+    return [DataclassParser(), ListParser(), IntParser(), StringParser()]
+
+
+@pytest.fixture
+def config_module(tmp_path: Path, monkeypatch) -> Any:
+    package = tmp_path / 'src'
+    package.mkdir()
+    (package / 'plan_cache_config.py').write_text(MODULE_SOURCE)
+    monkeypatch.syspath_prepend(str(package))
+    yield importlib.import_module('plan_cache_config')
+    sys.modules.pop('plan_cache_config', None)
+
+
+def test_load_missing_plan(tmp_path: Path):
+    assert load_plan(Outer, tmp_path) is False
+
+
+def test_round_trip(tmp_path: Path, fresh_caches):
+    data = {
+        "inner": {"x": 1, "tags": ["a"]},
+        "typed_dict": {"a": 1},
+        "named_tuple": [1, "b"],
+        "plain": {"x": 1},
+    }
+    expected = parse(Outer, data)
+    assert warm_plan(Outer, tmp_path) is False
+    assert len(list(tmp_path.iterdir())) == 1
+
+    for schema in SCHEMAS:
+        schema.entries.clear()
+
+    def no_introspection(field_type):
+        raise AssertionError(f'{field_type} was introspected')
+
+    decoder = Decoder()
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr('dict2any.plan_cache._get_decoder', lambda parsers: decoder)
+        for schema in SCHEMAS:
+            monkeypatch.setattr(schema, 'build', no_introspection)
+        assert warm_plan(Outer, tmp_path) is True
+        assert decoder.parse(Outer, data) == expected
+    assert Outer in decoder._plan
+
+
+def test_stale_source(tmp_path: Path, config_module, fresh_caches):
+    cache_dir = tmp_path / 'cache'
+    save_plan(config_module.Config, cache_dir, fresh_caches)
+    assert load_plan(config_module.Config, cache_dir, fresh_caches) is True
+
+    Path(config_module.__file__).write_text(MODULE_SOURCE + '    extra: int = 0\n')
+    assert load_plan(config_module.Config, cache_dir, fresh_caches) is False
+
+
+def test_stale_base_class(tmp_path: Path, monkeypatch, fresh_caches):
+    package = tmp_path / 'src'
+    package.mkdir()
+    (package / 'plan_cache_base.py').write_text(BASE_SOURCE)
+    (package / 'plan_cache_child.py').write_text(CHILD_SOURCE)
+    monkeypatch.syspath_prepend(str(package))
+    try:
+        child = importlib.import_module('plan_cache_child').Child
+        cache_dir = tmp_path / 'cache'
+        save_plan(child, cache_dir, fresh_caches)
+        assert load_plan(child, cache_dir, fresh_caches) is True
+
+        (package / 'plan_cache_base.py').write_text(BASE_SOURCE + '    z: int\n')
+        assert load_plan(child, cache_dir, fresh_caches) is False
+    finally:
+        sys.modules.pop('plan_cache_base', None)
+        sys.modules.pop('plan_cache_child', None)
+
+
+def test_parsers_are_part_of_the_key(tmp_path: Path, config_module, fresh_caches):
+    save_plan(config_module.Config, tmp_path, fresh_caches)
+    assert load_plan(config_module.Config, tmp_path) is False
+
+
+def test_corrupt_plan(tmp_path: Path, config_module, fresh_caches):
+    path = save_plan(config_module.Config, tmp_path, fresh_caches)
+    path.write_bytes(b'not a pickle')
+    assert load_plan(config_module.Config, tmp_path, fresh_caches) is False
+
+
+def test_duplicate_parser_classes(tmp_path: Path):
+    with pytest.raises(ValueError, match="more than one parser"):
+        save_plan(int, tmp_path, [IntParser(), DataclassParser(), DataclassParser()])
@@ -1,12 +1,12 @@
 from collections import namedtuple
 from inspect import isclass
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
 import pytest
 
 from dict2any.jq_path import JqPath
 from dict2any.parsers import Stage, Subparse
-from dict2any.parsers.tuple import NamedTupleParser, TupleParser
+from dict2any.parsers.tuple import NamedTupleParser, TupleParser, get_named_tuple_fields
 
 UntypedTuple = namedtuple("UntypedTuple", ["a", "b"])
 
@@ -141,3 +141,9 @@ def test_parse_named_tuple(field_type, data, expected, path: JqPath, subparser:
             NamedTupleParser().parse(path=path, field_type=field_type, data=data, subparse=subparser)
     else:
         assert NamedTupleParser().parse(path=path, field_type=field_type, data=data, subparse=subparser) == expected
+
+
+def test_named_tuple_fields():
+    assert get_named_tuple_fields(TypedTuple) == (("a", int), ("b", str))
+    assert get_named_tuple_fields(UntypedTuple) == (("a", Any), ("b", Any))
+    assert get_named_tuple_fields(TypedTuple) is get_named_tuple_fields(TypedTuple)
@@ -1,11 +1,37 @@
+from dataclasses import dataclass
 from inspect import isclass
-from typing import Any, Optional, Union
+from typing import (
+    Annotated,
+    Any,
+    Literal,
+    NamedTuple,
+    Optional,
+    TypedDict,
+    Union,
+    get_args,
+)
 
 import pytest
 
+from dict2any import Decoder, Discriminator, default_parsers, parse
+from dict2any.codegen import compile_decoder
 from dict2any.jq_path import JqPath
-from dict2any.parsers import Stage, Subparse
-from dict2any.parsers.union import UnionParser
+from dict2any.parsers import (
+    DataclassParser,
+    FloatParser,
+    IntParser,
+    ListParser,
+    LiteralParser,
+    NamedTupleParser,
+    NoneParser,
+    Parser,
+    Stage,
+    StringParser,
+    Subparse,
+    TupleParser,
+    TypedDictParser,
+)
+from dict2any.parsers.union import UnionParser, get_union_schema
 
 
 @pytest.mark.parametrize(
@@ -18,7 +44,11 @@ from dict2any.parsers.union import UnionParser
         (Stage.Exact, dict[str, Union[int, list]], False),
         (Stage.Exact, list[str], False),
         (Stage.Exact, Optional[str], True),
+        (Stage.Exact, int | None, True),
         (Stage.Fallback, Union, False),
+        (Stage.Fallback, Annotated[int | str, Discriminator('kind')], True),
+        (Stage.Fallback, Annotated[int | str, "other"], False),
+        (Stage.Fallback, Annotated[int, Discriminator('kind')], False),
     ],
 )
 def test_can_parse(stage: Stage, field_type: Any, expected: bool, path: JqPath):
@@ -41,3 +71,278 @@ def test_parse(field_type, data, expected, path: JqPath, subparser: Subparse):
             UnionParser().parse(path=path, field_type=field_type, data=data, subparse=subparser)
     else:
         assert UnionParser().parse(path=path, field_type=field_type, data=data, subparse=subparser) == expected
+
+
+@pytest.mark.parametrize(
+    ['field_type', "data", 'expected'],
+    [
+        (int | str, 1, 1),
+        (int | str, "hello", "hello"),
+        (int | None, None, None),
+        (list[int] | dict[str, int], {"a": 1}, {"a": 1}),
+        (list[int] | dict[str, int], [1], [1]),
+        (list[int] | list[str], ["a"], ["a"]),
+        (int | str, None, ValueError),
+        (list[int] | dict[str, int], "not_a_list", ValueError),
+    ],
+)
+def test_parse_with_decoder(field_type, data, expected):
+    if isclass(expected) and issubclass(expected, BaseException):
+        with pytest.raises(expected):
+            parse(field_type, data)
+    else:
+        assert parse(field_type, data) == expected
+
+
+def test_arms_are_filtered_by_input_types():
+    class Tagged:
+        pass
+
+    class MappingOnlyParser(Parser):
+        stages = (Stage.Exact,)
+        dispatch_types = {Stage.Exact: (Tagged,)}
+        input_types = (dict,)
+
+        def can_parse(self, stage, path, field_type):
+            raise AssertionError()
+
+        def parse(self, path, field_type, data, subparse):
+            if not isinstance(data, dict):
+                raise AssertionError("Should have been skipped")
+            return "tagged"
+
+    decoder = Decoder([MappingOnlyParser(), IntParser(), StringParser(), UnionParser()])
+    assert decoder.parse(Tagged | int, 5) == 5
+    assert decoder.parse(Tagged | int, {}) == "tagged"
+    with pytest.raises(ValueError, match="Invalid type"):
+        decoder.parse(Tagged | int, "text")
+
+
+@dataclass
+class Cat:
+    kind: Literal["cat"]
+    lives: int
+
+
+@dataclass
+class Dog:
+    kind: Literal["dog"]
+    good: bool = True
+
+
+class Bird(TypedDict):
+    kind: Literal["bird", "parrot"]
+    wings: int
+
+
+@dataclass
+class Untagged:
+    lives: int
+
+
+@dataclass
+class Zoo:
+    animals: list[Cat | Dog]
+    favourite: Annotated[Cat | Dog | None, Discriminator('kind')] = None
+
+
+def test_union_schema():
+    schema = get_union_schema(Cat | Dog | Bird | None)
+    assert schema.discriminator == 'kind'
+    assert schema.tags == {(str, "cat"): Cat, (str, "dog"): Dog, (str, "bird"): Bird, (str, "parrot"): Bird}
+    assert schema.requires_discriminator is False
+    assert get_union_schema(Cat | Untagged).discriminator is None
+    assert get_union_schema(Cat | int).discriminator is None
+    assert get_union_schema(Annotated[Cat | Dog, Discriminator('kind')]).requires_discriminator is True
+
+
+@pytest.mark.parametrize(
+    ['field_type', "data", 'expected'],
+    [
+        (Cat | Dog, {"kind": "dog"}, Dog(kind="dog")),
+        (Cat | Dog, {"kind": "cat", "lives": 9}, Cat(kind="cat", lives=9)),
+        (Cat | Dog | Bird, {"kind": "parrot", "wings": 2}, {"kind": "parrot", "wings": 2}),
+        (Cat | Dog | None, None, None),
+        (Cat | Dog, {"kind": "fish"}, ValueError),
+        (Cat | Dog, {"kind": ["unhashable"]}, ValueError),
+        (Cat | Dog, {"kind": "dog", "lives": 9}, ValueError),
+        (Cat | Dog, {"lives": 9}, ValueError),
+        (Annotated[Cat | Dog, Discriminator('kind')], {"kind": "dog"}, Dog(kind="dog")),
+        (Annotated[Cat | Dog | None, Discriminator('kind')], None, None),
+        (Annotated[Cat | Dog, Discriminator('kind')], {"lives": 9}, ValueError),
+        (Annotated[Cat | Untagged, Discriminator('kind')], {"lives": 9}, ValueError),
+        (list[Cat | Dog], [{"kind": "dog"}, {"kind": "cat", "lives": 1}], [Dog(kind="dog"), Cat(kind="cat", lives=1)]),
+    ],
+)
+def test_discriminated_union(field_type, data, expected):
+    if isclass(expected) and issubclass(expected, BaseException):
+        with pytest.raises(expected):
+            parse(field_type, data)
+    else:
+        assert parse(field_type, data) == expected
+
+
+class Owner(TypedDict):
+    pet: Annotated[Cat | Dog, Discriminator('kind')]
+
+
+def test_discriminator_of_typed_dict_field():
+    assert parse(Owner, {"pet": {"kind": "dog"}}) == {"pet": Dog(kind="dog")}
+    # Only an explicit Discriminator makes the key required
+    with pytest.raises(ValueError, match="Missing discriminator"):
+        parse(Owner, {"pet": {"lives": 9}})
+
+
+def test_discriminated_union_errors():
+    with pytest.raises(ValueError, match="Invalid kind: 'fish'"):
+        parse(Cat | Dog, {"kind": "fish"})
+    with pytest.raises(ValueError, match="Missing discriminator: kind"):
+        parse(Annotated[Cat | Dog, Discriminator('kind')], {})
+    with pytest.raises(ValueError, match="Missing required field: lives"):
+        parse(Cat | Dog, {"kind": "cat"})
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+@pytest.mark.parametrize(
+    ['parser', 'field_type', 'data', 'expected'],
+    [
+        (DataclassParser(), Untagged, {"lives": 9}, True),
+        (DataclassParser(), Untagged, {"lives": "nine"}, True),  # The values aren't checked
+        (DataclassParser(), Untagged, {}, False),
+        (DataclassParser(), Untagged, {"lives": 9, "other": 1}, False),
+        (DataclassParser(), Untagged, [9], False),
+        (DataclassParser(), Dog, {"kind": "dog"}, True),
+        (TypedDictParser(), Bird, {"kind": "bird", "wings": 2}, True),
+        (TypedDictParser(), Bird, {"kind": "bird"}, False),
+        (TypedDictParser(), Bird, {"kind": "bird", "wings": 2, "other": 1}, False),
+        (TupleParser(), tuple[int, str], [1, "a"], True),
+        (TupleParser(), tuple[int, str], [1], False),
+        (TupleParser(), tuple[int, ...], [1, 2, 3], True),
+        (NamedTupleParser(), Point, [1, 2], True),
+        (NamedTupleParser(), Point, {"x": 1, "y": 2}, True),
+        (NamedTupleParser(), Point, {"x": 1, "z": 2}, False),
+        (NamedTupleParser(), Point, [1], False),
+        (LiteralParser(), Literal["a", 1], 1, True),
+        (LiteralParser(), Literal["a", 1], True, False),
+        (LiteralParser(), Literal["a", 1], "b", False),
+    ],
+)
+def test_accepts(parser: Any, field_type: Any, data: Any, expected: bool):
+    assert parser.accepts(field_type=field_type, data=data) is expected
+
+
+def test_arms_which_dont_accept_the_data_arent_parsed():
+    parsed = []
+
+    class RecordingDataclassParser(DataclassParser):
+        def parse(self, *, path, field_type, data, subparse):
+            parsed.append(field_type)
+            return super().parse(path=path, field_type=field_type, data=data, subparse=subparse)
+
+    @dataclass
+    class A:
+        a: int
+
+    @dataclass
+    class B:
+        b: int
+
+    decoder = Decoder([RecordingDataclassParser(), IntParser(), UnionParser()])
+    assert decoder.parse(A | B, {"b": 1}) == B(b=1)
+    assert parsed == [B]
+    with pytest.raises(ValueError, match="Invalid type"):
+        decoder.parse(A | B, {"c": 1})
+    assert parsed == [B]
+
+
+def test_discriminated_union_only_parses_one_arm():
+    calls = []
+
+    class CountingDecoder(Decoder):
+        def subparse(self, *, path, field_type, data):
+            calls.append(field_type)
+            return super().subparse(path=path, field_type=field_type, data=data)
+
+        __call__ = subparse
+
+    CountingDecoder().subparse(path=JqPath.parse('.'), field_type=Cat | Dog | Bird, data={"kind": "bird", "wings": 2})
+    assert Cat not in calls and Dog not in calls and Bird in calls
+
+
+@dataclass
+class PointA:
+    x: int
+
+
+@dataclass
+class PointB:
+    x: int
+
+
+def test_unions_which_only_differ_in_order():
+    # A | B and B | A are equal, but each tries its arms in the order it declares them
+    assert parse(PointB | PointA, {"x": 1}) == PointB(x=1)
+    assert parse(PointA | PointB, {"x": 1}) == PointA(x=1)
+    assert compile_decoder(list[PointB | PointA])([{"x": 1}]) == [PointB(x=1)]
+    assert compile_decoder(list[PointA | PointB])([{"x": 1}]) == [PointA(x=1)]
+
+    _, union_parser = adaptive_decoder()
+    assert union_parser._ordered_arms(int | str, (int, str)) == (int, str)
+    assert union_parser._ordered_arms(str | int, (str, int)) == (str, int)
+
+
+def adaptive_decoder() -> tuple[Decoder, UnionParser]:
+    union_parser = UnionParser(adaptive=True)
+    return Decoder([IntParser(), StringParser(), FloatParser(), NoneParser(), union_parser]), union_parser
+
+
+def test_adaptive_union_counts_hits():
+    decoder, union_parser = adaptive_decoder()
+    field_type = int | float | None | str
+    for data in ["a", "b", 1, "c"]:
+        decoder.parse(field_type, data)
+    assert union_parser.hits[field_type] == {str: 3, int: 1}
+
+
+def test_adaptive_union_reorders_arms():
+    decoder, union_parser = adaptive_decoder()
+    field_type = int | float | None | str
+    assert union_parser._ordered_arms(field_type, get_args(field_type)) == (int, float, type(None), str)
+    for _ in range(3):
+        assert decoder.parse(field_type, "a") == "a"
+    assert union_parser._ordered_arms(field_type, get_args(field_type)) == (str, int, float, type(None))
+    assert decoder.parse(field_type, 1) == 1
+    assert decoder.parse(field_type, None) is None
+
+
+@dataclass
+class Node:
+    value: 'Union[list[Node], tuple[Any, ...], None]'
+
+
+def test_adaptive_recursive_union():
+    # The inner parse of the same union reorders its arms, while the outer parse is still trying them
+    data = {"value": [{"value": ["a"]}, 5]}
+    assert (
+        Decoder(default_parsers(UnionParser(adaptive=True))).parse(Node, data)
+        == parse(Node, data)
+        == Node(value=({"value": ["a"]}, 5))
+    )
+
+
+def test_adaptive_union_is_off_by_default():
+    union_parser = UnionParser()
+    Decoder([IntParser(), StringParser(), union_parser]).parse(int | str, "a")
+    assert union_parser.hits == {}
+
+
+def test_adaptive_union_with_compiled_decoder():
+    _, union_parser = adaptive_decoder()
+    parsers = [IntParser(), StringParser(), ListParser(), union_parser]
+    decode = compile_decoder(list[int | str], parsers)
+    assert decode([1, "a", "b"]) == [1, "a", "b"]
+    assert union_parser.hits[int | str] == {str: 2, int: 1}
@@ -0,0 +1,169 @@
+import array
+import json
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum, IntEnum
+from inspect import isclass
+from pathlib import Path, PurePosixPath
+from typing import Any, NamedTuple, TypedDict
+
+import pytest
+
+from dict2any import Encoder, parse, unparse
+
+
+@dataclass
+class Inner:
+    value: int
+
+
+@dataclass(frozen=True, slots=True)
+class Outer:
+    inner: Inner
+    path: Path
+    items: list[Inner]
+    pair: tuple[int, str]
+    optional: Inner | None = None
+    computed: int = field(init=False, default=0)
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+class Movie(TypedDict):
+    name: str
+    year: int
+
+
+class Plain:
+    def __init__(self, a: int, b: str):
+        self.a = a
+        self.b = b
+
+    def __eq__(self, other):
+        return isinstance(other, Plain) and (self.a, self.b) == (other.a, other.b)
+
+
+class Broken:
+    def __init__(self, a: int):
+        self.not_a = a
+
+
+class Color(IntEnum):
+    RED = 1
+
+
+class Shape(Enum):
+    SQUARE = 'square'
+
+
+class Size(str, Enum):
+    SMALL = 'small'
+
+
+@dataclass
+class Grid:
+    cells: dict[tuple[int, int], str]
+
+
+@pytest.mark.parametrize(
+    ['obj', 'expected'],
+    [
+        (None, None),
+        (True, True),
+        (1, 1),
+        (1.5, 1.5),
+        ("a", "a"),
+        (Color.RED, 1),
+        (Path('a/b'), 'a/b'),
+        (PurePosixPath('a/b'), 'a/b'),
+        ((1, "a"), [1, "a"]),
+        (Point(1, 2), [1, 2]),
+        ([Inner(1), 2], [{"value": 1}, 2]),
+        ({"a": Inner(1)}, {"a": {"value": 1}}),
+        ({Path('a'): 1}, {"a": 1}),
+        (OrderedDict(a=1), {"a": 1}),
+        (Movie(name="Blade Runner", year=1982), {"name": "Blade Runner", "year": 1982}),
+        (Inner(1), {"value": 1}),
+        (
+            Outer(inner=Inner(1), path=Path('a'), items=[Inner(2)], pair=(1, "a")),
+            {"inner": {"value": 1}, "path": "a", "items": [{"value": 2}], "pair": [1, "a"], "optional": None},
+        ),
+        (Plain(1, "b"), {"a": 1, "b": "b"}),
+        (array.array('i', [1, 2]), [1, 2]),
+        (Broken(1), ValueError),
+        (Shape.SQUARE, 'square'),
+        (Size.SMALL, 'small'),
+        ({Size.SMALL: 1}, {'small': 1}),
+        ({(1, 2): "a"}, {(1, 2): "a"}),
+        (b"bytes", ValueError),
+        (object(), ValueError),
+        (datetime(2020, 1, 1), ValueError),
+    ],
+)
+def test_unparse(obj: Any, expected: Any):
+    if isclass(expected) and issubclass(expected, BaseException):
+        with pytest.raises(expected):
+            unparse(obj)
+    else:
+        assert unparse(obj) == expected
+
+
+@pytest.mark.parametrize(
+    ['field_type', 'data'],
+    [
+        (Outer, {"inner": {"value": 1}, "path": "a", "items": [{"value": 2}], "pair": [1, "a"], "optional": None}),
+        (list[Point], [[1, 2], [3, 4]]),
+        (dict[str, Inner | Point], {"a": {"value": 1}, "b": [1, 2]}),
+        (Movie, {"name": "Blade Runner", "year": 1982}),
+        (Plain, {"a": 1, "b": "b"}),
+    ],
+)
+def test_round_trip(field_type: Any, data: Any):
+    obj = parse(field_type, data)
+    encoded = unparse(obj)
+    assert encoded == data
+    assert json.loads(json.dumps(encoded)) == encoded
+    assert parse(field_type, encoded) == obj
+
+
+def test_unchanged_containers_are_not_copied():
+    items = [1, "a", None, [2, 3], {"b": 4.5}]
+    assert unparse(items) is items
+    data = {"a": items, "b": {"c": True}}
+    assert unparse(data) is data
+    # Only the containers which change are copied
+    changed = {"a": items, "b": Inner(1)}
+    result = unparse(changed)
+    assert result is not changed
+    assert result["a"] is items
+    assert changed["b"] == Inner(1)
+
+
+def test_encoders_are_resolved_once_per_type():
+    encoder = Encoder()
+    calls = []
+    find_encoder = encoder._find_encoder
+
+    def counting_find_encoder(cls):
+        calls.append(cls)
+        return find_encoder(cls)
+
+    encoder._find_encoder = counting_find_encoder  # type: ignore
+    assert encoder.unparse([Inner(1), Inner(2), Inner(3)]) == [{"value": 1}, {"value": 2}, {"value": 3}]
+    assert calls == [list, Inner, int]
+
+
+def test_tuple_keys_round_trip():
+    grid = parse(Grid, {"cells": {(1, 2): "a"}})
+    assert unparse(grid) == {"cells": {(1, 2): "a"}}
+    assert parse(Grid, unparse(grid)) == grid
+
+
+def test_custom_encoders():
+    encoder = Encoder({Shape: lambda shape: shape.name, Inner: lambda inner: inner.value})
+    assert encoder.unparse([Shape.SQUARE, Inner(1)]) == ['SQUARE', 1]
+    assert unparse(Shape.SQUARE, encoders={Enum: lambda e: e.name}) == 'SQUARE'